@@ -5,6 +5,8 @@
 """
 
 from haver.haver import Haver
+from haver.async_haver import AsyncHaver
+from haver.exceptions import HaverAPIError, HaverAuthError, CircuitOpenError
 
 __about__ = "A Python wrapper to Haver Analytics' RESTful API."
 __version__= '0.9.0'
@@ -0,0 +1,10 @@
+"""  Created on 18/10/2026::
+------------- __main__.py -------------
+
+**Authors**: L. Mingarelli
+"""
+
+import sys
+from haver.cli import main
+
+sys.exit(main())
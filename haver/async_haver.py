@@ -0,0 +1,329 @@
+"""  Created on 18/10/2026::
+------------- async_haver.py -------------
+
+Asynchronous counterpart of `haver.haver.Haver`, built on `aiohttp`.
+
+**Authors**: L. Mingarelli
+"""
+
+import asyncio, os, ssl, time, warnings
+from collections.abc import Iterable
+from typing import Optional, Union, Dict, List, Tuple, AsyncIterator, TYPE_CHECKING
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+from haver.haver import _frame_from_json, _series_arrays, _trim_series, _window, _loads
+from haver.scheduler import RetryPolicy, RateLimiter, CircuitBreaker
+from haver.exceptions import HaverAPIError, HaverAuthError, CircuitOpenError
+from haver.instrumentation import Instrumentation
+
+
+class AsyncHaver:
+    """Asynchronous implementation of the Haver View REST API.
+
+    All requests share a single `aiohttp` connection pool, created on first use,
+    and multi-series reads are multiplexed over it with a semaphore-bounded `asyncio.gather`.
+    Authentication and proxies are handled as in `Haver`, with the API key validated lazily
+    by the first request, which raises `haver.HaverAuthError` if the key is invalid. Requires `aiohttp`.
+
+    Args:
+        api_key: Personal access API key. Defaults to the environment variable `HAVER_API_KEY`.
+        verify: Either a boolean or a path to a CA bundle.
+        proxies: A dictionary mapping protocol to proxy URL, as in `requests`.
+        request_kwargs: Additional keyword arguments passed to every `aiohttp` request.
+        limit: Maximum total number of simultaneous connections.
+        limit_per_host: Maximum number of simultaneous connections per host.
+        timeout: Total request timeout in seconds.
+        max_concurrency: Default maximum number of in-flight series requests in `read_df`.
+        retry: A `haver.scheduler.RetryPolicy`, or the maximum number of retries, as in `Haver`.
+        rate_limit: A `haver.scheduler.RateLimiter`, or a maximum number of requests per second.
+        circuit_breaker: Optional `haver.scheduler.CircuitBreaker`, failing fast while the API is down.
+        hooks: Instrumentation hooks, as in `Haver`.
+        base_url: Root URL of the API. Defaults to `https://api.haverview.com`.
+
+    Examples:
+        >>> from haver import AsyncHaver
+        >>> async with AsyncHaver(api_key='<your-api-key>') as haver:
+        ...     df = await haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'])
+    """
+    _HAVER_URL = 'https://api.haverview.com'
+    __NO_APIKEY_WARNING = """
+    Invalid or Expired Haver api_key.
+    Please set as environment variable `HAVER_API_KEY` or initialise haver as  AsyncHaver(api_key='<your-api-key>').
+        """
+
+    def __init__(self, api_key: Optional[str] = None,
+                 verify=None, proxies=None,
+                 request_kwargs: Union[Dict, None] = None,
+                 limit: int = 100, limit_per_host: int = 100,
+                 timeout: Optional[float] = None,
+                 max_concurrency: int = 16,
+                 retry: Union[RetryPolicy, int, None] = None,
+                 rate_limit: Union[RateLimiter, float, None] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 hooks: Optional[Iterable] = None,
+                 base_url: Optional[str] = None):
+        self.__api_key = api_key or os.environ.get('HAVER_API_KEY')
+        if not self.__api_key:
+            warnings.warn(self.__NO_APIKEY_WARNING)
+        self._headers = {'Content-Type': 'application/json',
+                         'X-API-Key': self.__api_key or ''}
+        self._request_kwargs = dict(request_kwargs or {})
+        if proxies:
+            proxy = proxies.get('https') or proxies.get('http')
+            self._request_kwargs = {'proxy': proxy, **self._request_kwargs}
+        if isinstance(verify, str):
+            self._ssl = ssl.create_default_context(cafile=verify)
+        else:
+            self._ssl = False if verify is False else None
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+        self._session = None
+        if base_url:
+            self._HAVER_URL = base_url.rstrip('/')
+        self._retry = retry if isinstance(retry, RetryPolicy) else RetryPolicy(**({} if retry is None else dict(max_retries=retry)))
+        self._rate_limiter = rate_limit if isinstance(rate_limit, RateLimiter) else RateLimiter(rate=rate_limit)
+        self._circuit_breaker = circuit_breaker
+        self._instrumentation = Instrumentation(hooks)
+        self._in_flight = {}
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("AsyncHaver requires `aiohttp`, which can be installed as `pip install aiohttp`.") from e
+            connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host,
+                                             ssl=self._ssl)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._headers,
+                                                  timeout=aiohttp.ClientTimeout(total=self._timeout))
+        return self._session
+
+    async def _get_json(self, url: str):
+        # Identical concurrent requests share a single in-flight call
+        task = self._in_flight.get(url)
+        shared = task is not None
+        if not shared:
+            task = self._in_flight[url] = asyncio.ensure_future(self.__fetch_json(url))
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        self._instrumentation.cache('single_flight', shared)
+        return await asyncio.shield(task)
+
+    async def __fetch_json(self, url: str, **kwargs):
+        import aiohttp
+        session = await self._get_session()
+        kwargs = {**self._request_kwargs, **kwargs}
+        started, attempt = time.perf_counter(), 0
+        while True:
+            try:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.before_request(url)
+                wait = self._rate_limiter.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+                async with session.get(url, **kwargs) as response:
+                    status, retry_after = response.status, response.headers.get('Retry-After')
+                    content = await response.read()
+            except CircuitOpenError as e:
+                self._instrumentation.request(url, None, 0, started, attempt, error=e)
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_failure()
+                if attempt >= self._retry.max_retries:
+                    error = HaverAPIError(f"Request to {url} failed: {e!r}", url=url)
+                    self._instrumentation.request(url, None, 0, started, attempt, error=error)
+                    raise error from e
+                retry_after = None
+            except BaseException:
+                # No exception, including cancellation, may leave a trial request of the circuit breaker pending
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.release_trial()
+                raise
+            else:
+                if self._circuit_breaker is not None:
+                    if status >= 500:
+                        self._circuit_breaker.record_failure()
+                    else:
+                        self._circuit_breaker.record_success()
+                if status not in self._retry.retry_statuses or attempt >= self._retry.max_retries:
+                    self._instrumentation.request(url, status, len(content), started, attempt)
+                if status < 400:
+                    with self._instrumentation.stage('decode'):
+                        return _loads(content)
+                if status in (401, 403):
+                    raise HaverAuthError(self.__NO_APIKEY_WARNING.strip(), status_code=status, url=url)
+                if status not in self._retry.retry_statuses or attempt >= self._retry.max_retries:
+                    raise HaverAPIError(f"Request to {url} failed with status {status}: {content[:200].decode(errors='replace')}",
+                                        status_code=status, url=url)
+            await asyncio.sleep(self._retry.delay(attempt, retry_after))
+            attempt += 1
+
+    async def close(self):
+        """Closes the underlying session and all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def is_connected(self) -> bool:
+        """Tests the connection and validity of the API key."""
+        session = await self._get_session()
+        try:
+            async with session.get(f'{self._HAVER_URL}/v4/docs', **self._request_kwargs) as response:
+                return response.status == 200
+        except Exception:
+            return False
+
+    async def get_databases(self) -> Dict:
+        """
+        Lists all available databases.
+
+        Returns:
+            Dict
+        """
+        dbs = await self._get_json(f'{self._HAVER_URL}/v4/database?&per_page=1000')
+        return {db['name']: db['description'] for db in dbs}
+
+    async def _get_series_page(self, database: str, page: Optional[str] = None) -> List[Dict]:
+        return (await self._get_json(
+            f"{self._HAVER_URL}/v4/database/{database}/series?{f'&page={page}' if page else ''}&per_page=1000"))['data']
+
+    async def iter_series_pages(self, database: str) -> AsyncIterator[List[Dict]]:
+        """Asynchronously yields the full metadata of all series in `database`, one page of up to 1000 series at a time.
+
+        Examples:
+            >>> async for page in haver.iter_series_pages('USECON'):
+            ...     print(len(page))
+        """
+        series = await self._get_series_page(database)
+        yield series
+        while len(series)==1000:
+            page = series[-1]['name']
+            series = await self._get_series_page(database, page=page)
+            yield [s for s in series if s['name']!=page]
+
+    async def get_series(self, database: str,
+                         like: Union[str, None] = None,
+                         full_info: bool = False):
+        """Returns list of series available in a given database, as `Haver.get_series`.
+
+        Args:
+            database: Name of the Haver database.
+            like: String used to search for similar series names. In this case results are limited to the first 1000.
+            full_info: If `True`, returns the full metadata of each series instead of a `{name: description}` dictionary.
+
+        Returns:
+            Dict or List[Dict]
+        """
+        if like:
+            series = await self._get_series_page(database, page=like)
+        else:
+            series = [s async for page in self.iter_series_pages(database) for s in page]
+        if not full_info:
+            series = {s['name']: s['description'] for s in series}
+        return series
+
+    async def recessions(self) -> 'pd.DataFrame':
+        """
+        Returns all available recessions with associated start and end dates, and country.
+        """
+        import pandas as pd
+        rec = (await self._get_json(f"{self._HAVER_URL}/v4/data/recessions?&per_page=1000"))['data']
+        return pd.DataFrame(rec).drop(columns='index')
+
+    async def read(self, database: str, series: str, **window) -> Dict:
+        """
+        Args:
+            database: An Haver database.
+            series: A Haver series available within `database`.
+            **window: `start`, `end` and `last_n`, as in `Haver.read`.
+
+        Returns:
+            Dict
+        """
+        if not isinstance(series, str):
+            raise ValueError(f"The argument 'series' must be a string, instead {type(series)} was passed.")
+        if not isinstance(database, str):
+            raise ValueError(f"The argument 'database' must be a string, instead {type(database)} was passed.")
+        _window(**window)
+        return _trim_series(await self._get_json(f'{self._HAVER_URL}/v4/database/{database}/series/{series}'),
+                            **window)
+
+    async def read_arrays(self, database: str, series: str, **window) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Reads a series as a pair of `datetime64[D]` dates and `float64` values arrays, as `Haver.read_arrays`."""
+        return _series_arrays(await self.read(database=database, series=series, **window))
+
+    async def _read_many(self, haver_codes: list,
+                         max_concurrency: int,
+                         errors: str = 'raise',
+                         **window) -> Tuple[List, Dict]:
+        if errors not in ('raise', 'warn', 'ignore'):
+            raise ValueError(f"The argument 'errors' must be one of 'raise', 'warn' or 'ignore', instead '{errors}' was passed.")
+        _window(**window)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch(haver_code):
+            series, database = haver_code.split(sep='@')
+            async with semaphore:
+                content_json = await self.read(database=database, series=series, **window)
+            if 'dataPoints' not in content_json:
+                raise ValueError(f"No data returned for '{haver_code}': {content_json}")
+            return content_json
+
+        # Each distinct code is only read once
+        unique_codes = list(dict.fromkeys(haver_codes))
+        tasks = [asyncio.ensure_future(_fetch(haver_code)) for haver_code in unique_codes]
+        try:
+            outcomes = dict(zip(unique_codes, await asyncio.gather(*tasks, return_exceptions=errors != 'raise')))
+        except BaseException:
+            # gather does not cancel the remaining requests when one of them fails
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        failed = {}
+        for haver_code, content_json in outcomes.items():
+            if isinstance(content_json, BaseException):
+                if errors == 'warn':
+                    warnings.warn(f"Failed to read '{haver_code}': {content_json!r}")
+                outcomes[haver_code], failed[haver_code] = None, content_json
+        return [(haver_code, outcomes[haver_code]) for haver_code in haver_codes], failed
+
+    async def read_df(self, haver_codes: list,
+                      max_concurrency: Optional[int] = None,
+                      errors: str = 'raise',
+                      wide: bool = False,
+                      **window) -> 'pd.DataFrame':
+        """Reads multiple series concurrently, as `Haver.read_df`.
+
+        Args:
+            haver_codes: A list of haver codes constructed as `{series}@{database}`
+            max_concurrency: Maximum number of in-flight requests. Defaults to the `max_concurrency` of the client.
+            errors: One of `'raise'` (default), `'warn'` or `'ignore'`, as in `Haver.read_df`.
+            wide: If `True`, returns a date × series matrix instead of a long DataFrame.
+            **window: `start`, `end` and `last_n`, as in `Haver.read_df`.
+
+        Returns:
+            pandas.DataFrame
+        """
+        if not isinstance(haver_codes, Iterable) or isinstance(haver_codes, str):
+            raise ValueError(
+                f"The argument 'haver_codes' should be a list-like iterable, instead {type(haver_codes)} was received.")
+        haver_codes = list(haver_codes)
+
+        with self._instrumentation.stage('read_df.fetch'):
+            results, failed = await self._read_many(haver_codes, max_concurrency=max_concurrency or self._max_concurrency,
+                                                    errors=errors, **window)
+        with self._instrumentation.stage('read_df.build'):
+            df_final = _frame_from_json([(haver_code, content_json) for haver_code, content_json in results
+                                         if content_json is not None], wide=wide)
+        df_final.attrs['errors'] = failed
+        return df_final
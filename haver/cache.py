@@ -0,0 +1,113 @@
+"""  Created on 18/10/2026::
+------------- cache.py -------------
+
+**Authors**: L. Mingarelli
+"""
+
+import json, os, sqlite3, threading, time, zlib
+from typing import Optional, Dict, Tuple
+
+
+class SeriesCache:
+    """Persistent on-disk cache of series payloads, keyed by `(database, series)`.
+
+    Payloads are stored as zlib-compressed JSON in a SQLite file, together with the
+    series' `datetimeLastModified`, which is used to revalidate entries before they are served.
+    When a size limit is exceeded, the least recently used entries are evicted.
+
+    Args:
+        path: Path to the SQLite file backing the cache. It is created if it does not exist.
+        max_bytes: Maximum total size of the compressed payloads. Default is `None` (unbounded).
+        max_entries: Maximum number of cached series. Default is `None` (unbounded).
+
+    Examples:
+        >>> from haver import Haver
+        >>> from haver.cache import SeriesCache
+        >>> haver = Haver(cache=SeriesCache('~/.haver/series.db', max_bytes=2**30))
+    """
+
+    def __init__(self, path: str,
+                 max_bytes: Optional[int] = None,
+                 max_entries: Optional[int] = None):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS series (
+                                      database TEXT NOT NULL,
+                                      series TEXT NOT NULL,
+                                      last_modified TEXT,
+                                      payload BLOB NOT NULL,
+                                      size INTEGER NOT NULL,
+                                      accessed REAL NOT NULL,
+                                      PRIMARY KEY (database, series))""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS series_accessed ON series (accessed)")
+
+    @staticmethod
+    def _key(database: str, series: str) -> Tuple[str, str]:
+        return database.upper(), series.upper()
+
+    def get(self, database: str, series: str) -> Optional[Tuple[Dict, Optional[str]]]:
+        """Returns the cached `(payload, last_modified)` pair, or `None` if the series is not cached."""
+        key = self._key(database, series)
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT payload, last_modified FROM series WHERE database=? AND series=?",
+                                     key).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE series SET accessed=? WHERE database=? AND series=?", (time.time(), *key))
+        return json.loads(zlib.decompress(row[0])), row[1]
+
+    def put(self, database: str, series: str, payload: Dict, last_modified: Optional[str]):
+        """Stores `payload`, evicting least recently used entries if size limits are exceeded."""
+        blob = zlib.compress(json.dumps(payload, separators=(',', ':')).encode())
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?, ?, ?)",
+                               (*self._key(database, series), last_modified, blob, len(blob), time.time()))
+            self._evict()
+
+    def discard(self, database: str, series: str):
+        """Removes a series from the cache, if present."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM series WHERE database=? AND series=?", self._key(database, series))
+
+    def _evict(self):
+        n, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM series").fetchone()
+        if (self.max_entries is None or n <= self.max_entries) and (self.max_bytes is None or size <= self.max_bytes):
+            return
+        evict = []
+        for database, series, entry_size in self._conn.execute(
+                "SELECT database, series, size FROM series ORDER BY accessed"):
+            if (self.max_entries is None or n <= self.max_entries) and (self.max_bytes is None or size <= self.max_bytes):
+                break
+            evict.append((database, series))
+            n, size = n - 1, size - entry_size
+        self._conn.executemany("DELETE FROM series WHERE database=? AND series=?", evict)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM series")
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the compressed payloads."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM series").fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM series").fetchone()[0]
+
+    def __contains__(self, key: Tuple[str, str]):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM series WHERE database=? AND series=?",
+                                      self._key(*key)).fetchone() is not None
+
+    def close(self):
+        """Closes the underlying SQLite connection."""
+        self._conn.close()
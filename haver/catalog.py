@@ -0,0 +1,207 @@
+"""  Created on 18/10/2026::
+------------- catalog.py -------------
+
+**Authors**: L. Mingarelli
+"""
+
+import hashlib, json, os, sqlite3, threading, time
+from typing import Optional, Dict, List, Union, Iterable
+
+
+class SeriesCatalog:
+    """Local, indexed catalog of series metadata, backed by SQLite.
+
+    The catalog stores the `full_info` metadata returned by `Haver.get_series` for the
+    databases synced into it, and answers `get_series` and filtered or full-text searches
+    without hitting the network. Full-text search uses SQLite's FTS5 extension when available,
+    and falls back to substring matching otherwise.
+
+    Args:
+        path: Path to the SQLite file backing the catalog. It is created if it does not exist.
+
+    Examples:
+        >>> from haver import Haver
+        >>> from haver.catalog import SeriesCatalog
+        >>> catalog = SeriesCatalog('~/.haver/catalog.db')
+        >>> haver = Haver(catalog=catalog)
+        >>> catalog.sync(haver, databases=['USECON', 'EUDATA'])
+        >>> catalog.search('employment', frequency='M', geography='111')
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS databases (
+                                      name TEXT PRIMARY KEY,
+                                      fingerprint TEXT,
+                                      synced REAL NOT NULL)""")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS series (
+                                      database TEXT NOT NULL,
+                                      name TEXT NOT NULL,
+                                      position INTEGER NOT NULL,
+                                      description TEXT,
+                                      frequency TEXT,
+                                      geography TEXT,
+                                      geography2 TEXT,
+                                      last_modified TEXT,
+                                      info TEXT NOT NULL,
+                                      PRIMARY KEY (database, name))""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS series_frequency ON series (frequency)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS series_geography ON series (geography)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS series_geography2 ON series (geography2)")
+            try:
+                self._conn.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS series_fts
+                                      USING fts5(database UNINDEXED, name, description)""")
+                self._fts = True
+            except sqlite3.OperationalError:
+                self._fts = False
+
+    @property
+    def databases(self) -> List[str]:
+        """Names of the databases synced into the catalog."""
+        with self._lock:
+            return [name for name, in self._conn.execute("SELECT name FROM databases ORDER BY name")]
+
+    def __contains__(self, database: str):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM databases WHERE name=?",
+                                      (database.upper(),)).fetchone() is not None
+
+    @staticmethod
+    def _fingerprint(record: Dict) -> str:
+        return hashlib.sha1(json.dumps(record, sort_keys=True).encode()).hexdigest()
+
+    def sync(self, haver, databases: Union[Iterable[str], None] = None,
+             force: bool = False,
+             max_age: Optional[float] = 86400.) -> List[str]:
+        """Syncs series metadata from the API into the catalog.
+
+        A database is re-paged only if it is not in the catalog yet, if its record in the
+        database listing has changed since the last sync, if its last sync is older than
+        `max_age` seconds, or if `force=True`.
+        The record in the database listing does not reflect changes to the series of a database,
+        which the API offers no cheaper way to detect than paging through them: `max_age`
+        therefore bounds how stale the catalog can get, by default one day.
+
+        Args:
+            haver: A connected `Haver` instance.
+            databases: Names of the databases to sync. Default is all databases already in the catalog.
+            force: If `True`, re-pages all `databases` regardless of whether they changed.
+            max_age: Maximum age in seconds of a sync before a database is re-paged anyway. Default is one day;
+                     `None` only re-pages databases whose record in the database listing has changed.
+
+        Returns:
+            List of the databases which were re-paged.
+        """
+        databases = self.databases if databases is None else [db.upper() for db in databases]
+        records = {db['name'].upper(): db for db in haver._list_databases()}
+        with self._lock:
+            synced = {name: (fingerprint, ts) for name, fingerprint, ts in
+                      self._conn.execute("SELECT name, fingerprint, synced FROM databases")}
+
+        refreshed = []
+        for database in databases:
+            if database not in records:
+                raise ValueError(f"Database '{database}' is not available.")
+            fingerprint = self._fingerprint(records[database])
+            if (not force and database in synced and synced[database][0] == fingerprint
+                    and (max_age is None or time.time() - synced[database][1] <= max_age)):
+                continue
+            self._store(database, haver._list_series(database), fingerprint)
+            refreshed.append(database)
+        return refreshed
+
+    def _store(self, database: str, series: List[Dict], fingerprint: str):
+        rows = [(database, s['name'], n, s.get('description'), s.get('frequency'),
+                 s.get('geography'), s.get('geography2'), s.get('datetimeLastModified'), json.dumps(s))
+                for n, s in enumerate(series)]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM series WHERE database=?", (database,))
+            self._conn.executemany("INSERT INTO series VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if self._fts:
+                self._conn.execute("DELETE FROM series_fts WHERE database=?", (database,))
+                self._conn.executemany("INSERT INTO series_fts VALUES (?, ?, ?)",
+                                       [(database, row[1], row[3]) for row in rows])
+            self._conn.execute("INSERT OR REPLACE INTO databases VALUES (?, ?, ?)",
+                               (database, fingerprint, time.time()))
+
+    def get_series(self, database: str,
+                   like: Union[str, None] = None,
+                   full_info: bool = False):
+        """Returns the series of a synced database, with the same semantics as `Haver.get_series`."""
+        query = "SELECT info FROM series WHERE database=?"
+        params = [database.upper()]
+        if like:
+            query += " AND name>=? ORDER BY name LIMIT 1000"
+            params.append(like)
+        else:
+            query += " ORDER BY position"
+        with self._lock:
+            series = [json.loads(info) for info, in self._conn.execute(query, params)]
+        if not full_info:
+            series = {s['name']: s['description'] for s in series}
+        return series
+
+    def search(self, query: Optional[str] = None,
+               database: Union[str, Iterable[str], None] = None,
+               prefix: Optional[str] = None,
+               frequency: Optional[str] = None,
+               geography: Union[str, Iterable[str], None] = None,
+               limit: Optional[int] = None) -> List[Dict]:
+        """Searches the catalog offline.
+
+        Args:
+            query: Full-text query matched against series names and descriptions.
+            database: A database name, or a list of them, to restrict the search to.
+            prefix: Series name prefix.
+            frequency: Haver frequency code, e.g. `'M'` or `'Q'`.
+            geography: A Haver geography code, or a list of them, matched against both `geography` and `geography2`.
+            limit: Maximum number of results.
+
+        Returns:
+            List of dictionaries with the full metadata of the matching series.
+        """
+        clauses, params = [], []
+        if database is not None:
+            databases = [database] if isinstance(database, str) else list(database)
+            clauses.append(f"s.database IN ({','.join('?' * len(databases))})")
+            params.extend(db.upper() for db in databases)
+        if prefix:
+            clauses.append("s.name LIKE ? ESCAPE '\\'")
+            params.append(prefix.upper().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+        if frequency:
+            clauses.append("s.frequency=?")
+            params.append(frequency)
+        if geography:
+            geographies = [geography] if isinstance(geography, str) else list(geography)
+            placeholders = ','.join('?' * len(geographies))
+            clauses.append(f"(s.geography IN ({placeholders}) OR s.geography2 IN ({placeholders}))")
+            params.extend(geographies * 2)
+
+        if query and self._fts:
+            sql = ("SELECT s.info FROM series_fts f JOIN series s ON s.database=f.database AND s.name=f.name "
+                   "WHERE series_fts MATCH ?")
+            terms = ' '.join('"' + term.replace('"', '""') + '"*' for term in query.split())
+            params.insert(0, terms)
+            order = " ORDER BY f.rank"
+        else:
+            sql = "SELECT s.info FROM series s WHERE 1=1"
+            if query:
+                for term in query.split():
+                    clauses.append("(s.description LIKE ? OR s.name LIKE ?)")
+                    params.extend([f'%{term}%', f'%{term}%'])
+            order = " ORDER BY s.database, s.position"
+        sql += ''.join(f" AND {clause}" for clause in clauses) + order
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [json.loads(info) for info, in self._conn.execute(sql, params)]
+
+    def close(self):
+        """Closes the underlying SQLite connection."""
+        self._conn.close()
@@ -0,0 +1,250 @@
+"""  Created on 18/10/2026::
+------------- cli.py -------------
+
+Command-line interface, available as `haver` or `python -m haver`.
+
+Usage:
+    haver mirror --path ~/haver_mirror EUDATA USECON N997CE@EUDATA [--workers 16] [--format ipc]
+
+**Authors**: L. Mingarelli
+"""
+
+import argparse, json, os, shutil, sys, time
+from itertools import islice
+from typing import Optional, List, Dict, Iterator, Iterable
+
+from haver.haver import Haver, _frame_from_json
+from haver.exceptions import HaverAPIError
+from haver.instrumentation import StatsCollector
+from haver.store import write_store, load_store, _check_format
+
+_MIRROR_DIR = '.mirror'  # Ignored by dataset discovery, as are all paths starting with '.'
+
+
+class MirrorCheckpoint:
+    """Progress of a mirror run, stored as a JSON file next to the staged data.
+
+    Args:
+        path: Path to the JSON file. It is created on the first save.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self._state = json.load(f)
+        else:
+            self._state = {'targets': None, 'format': None, 'done': [], 'failed': {}}
+        self._done = set(self._state['done'])
+
+    def matches(self, targets: List[str], format: str) -> bool:
+        """Whether the checkpoint belongs to a run of the same `targets` and `format`."""
+        return self._state['targets'] == sorted(targets) and self._state['format'] == format
+
+    def start(self, targets: List[str], format: str):
+        self._state = {'targets': sorted(targets), 'format': format, 'done': [], 'failed': {}}
+        self._done = set()
+        self._save()
+
+    @property
+    def done(self) -> set:
+        return self._done
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        return self._state['failed']
+
+    def update(self, done: List[str], failed: Dict[str, BaseException]):
+        """Records the codes written to the staging dataset, and those which failed to be read, and saves."""
+        self._done.update(done)
+        self._state['done'] = sorted(self._done)
+        for haver_code in done:
+            self._state['failed'].pop(haver_code, None)
+        self._state['failed'].update({haver_code: repr(e) for haver_code, e in failed.items()})
+        self._save()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self.path)
+
+
+def _iter_codes(haver: Haver, targets: List[str]) -> Iterator[str]:
+    """Expands `targets` into Haver codes: databases are listed page by page, codes `{series}@{database}` are kept."""
+    for target in targets:
+        if '@' in target:
+            yield target
+        else:
+            for page in haver._iter_series_pages(target):
+                for s in page:
+                    yield f"{s['name']}@{target}"
+
+
+def _series_of(haver_codes: Iterable[str], database: str) -> List[str]:
+    """Names of the series of `database` among `haver_codes`, lowercase as in the `variable` column of the store."""
+    return [series.lower() for series, db in (haver_code.split(sep='@') for haver_code in haver_codes)
+            if db.lower() == database]
+
+
+def _finalize(path: str, staging: str, format: str, targets: List[str], done: Iterable[str], failed: Iterable[str]):
+    """Moves the partitions of `staging` into `path`, one database at a time.
+
+    The partition of a database mirrored as a whole is replaced, except for the rows of series which failed
+    to be read, which are carried over. For databases mirrored through Haver codes, only the rows of the series
+    written are replaced, and all other series already in the partition are kept.
+    """
+    whole_databases = {target.lower() for target in targets if '@' not in target}
+    for name in sorted(os.listdir(staging)):
+        database = name.split(sep='=', maxsplit=1)[1]
+        target = os.path.join(path, name)
+        if os.path.exists(target):
+            if database in whole_databases:
+                kept_series = _series_of(failed, database)
+                kept = load_store(path, haver_codes=[f'{series}@{database}' for series in kept_series],
+                                  format=format) if kept_series else None
+            else:
+                old = load_store(path, databases=[database], format=format)
+                kept = old[~old.variable.isin(_series_of(done, database))]
+            if kept is not None and len(kept):
+                write_store(kept, staging, format=format, mode='append')
+            trash = os.path.join(path, _MIRROR_DIR, f'old-{name}')
+            os.replace(target, trash)
+            shutil.rmtree(trash)
+        os.replace(os.path.join(staging, name), target)
+    shutil.rmtree(os.path.join(path, _MIRROR_DIR))
+
+
+def mirror(haver: Haver, targets: List[str], path: str,
+           format: str = 'parquet',
+           max_workers: int = 8,
+           chunk_size: int = 500,
+           errors: str = 'warn',
+           restart: bool = False,
+           log=sys.stderr) -> Dict:
+    """Downloads whole databases and lists of codes into a columnar dataset at `path`.
+
+    Series are read in chunks of `chunk_size` codes with `max_workers` concurrent requests, and each chunk
+    is written to a staging dataset under `{path}/.mirror`, while a checkpoint records the codes written.
+    An interrupted run resumes from the checkpoint, reading only the remaining series. Once all series
+    are read, the partitions of databases mirrored as a whole are replaced by the staged ones, while series
+    mirrored through Haver codes are merged into their partition. Previously stored rows of series which
+    failed to be read are kept.
+
+    Args:
+        haver: The client used for the downloads.
+        targets: Database names, e.g. `'EUDATA'`, and Haver codes `{series}@{database}`.
+        path: Root directory of the dataset, see `haver.store.write_store`.
+        format: Either `'parquet'` (default) or `'ipc'`.
+        max_workers: Maximum number of concurrent requests.
+        chunk_size: Number of series read and written at a time.
+        errors: One of `'raise'`, `'warn'` (default) or `'ignore'`. With `'raise'`, the run stops at the first
+                series failing to be read, and can be resumed. Otherwise, failed series are skipped and reported.
+        restart: If `True`, discards the checkpoint of a previous unfinished run instead of raising.
+        log: Stream to which progress is written, or `None`.
+
+    Returns:
+        Dictionary of throughput statistics of the run.
+    """
+    _check_format(format)
+    if not targets:
+        raise ValueError("At least one database or Haver code must be passed.")
+    if chunk_size < 1:
+        raise ValueError(f"The argument 'chunk_size' should be a positive integer, instead {chunk_size} was received.")
+    path = os.path.expanduser(path)
+    staging = os.path.join(path, _MIRROR_DIR, 'staging')
+    checkpoint = MirrorCheckpoint(os.path.join(path, _MIRROR_DIR, 'checkpoint.json'))
+    if not checkpoint.matches(targets, format):
+        if os.path.exists(staging) and not restart:
+            raise ValueError(f"An unfinished mirror run with different targets exists in '{path}'; "
+                             f"pass `restart=True` (`--restart`) to discard it.")
+        shutil.rmtree(staging, ignore_errors=True)
+        checkpoint.start(targets, format)
+    resumed = len(checkpoint.done)
+
+    stats = StatsCollector()
+    haver.add_hook(stats)
+    started = time.perf_counter()
+    n_series, n_rows = 0, 0
+    try:
+        pending = (haver_code for haver_code in _iter_codes(haver, targets) if haver_code not in checkpoint.done)
+        while True:
+            chunk = list(islice(pending, chunk_size))
+            if not chunk:
+                break
+            results, failed = haver._read_many(chunk, max_workers=max_workers, errors=errors)
+            done = [haver_code for haver_code, content_json in results if content_json is not None]
+            df = _frame_from_json([(haver_code, content_json) for haver_code, content_json in results
+                                   if content_json is not None], metadata=('frequency',))
+            if len(df):
+                write_store(df, staging, format=format, mode='append')
+            checkpoint.update(done, failed)
+            n_series, n_rows = n_series + len(done), n_rows + len(df)
+            if log is not None:
+                seconds = time.perf_counter() - started
+                print(f"{resumed + n_series} series written, {len(checkpoint.failed)} failed, "
+                      f"{n_series / seconds:.1f} series/s, {n_rows / seconds:.0f} rows/s", file=log)
+    finally:
+        haver.remove_hook(stats)
+
+    failed = dict(checkpoint.failed)
+    if os.path.exists(staging):
+        _finalize(path, staging, format=format, targets=targets, done=checkpoint.done, failed=failed)
+    else:
+        shutil.rmtree(os.path.join(path, _MIRROR_DIR), ignore_errors=True)
+
+    seconds = time.perf_counter() - started
+    snapshot = stats.snapshot()
+    summary = {'series': n_series, 'resumed': resumed, 'failed': failed, 'rows': n_rows, 'seconds': seconds,
+               'series_per_second': n_series / seconds if seconds else 0.,
+               'rows_per_second': n_rows / seconds if seconds else 0.,
+               'requests': sum(r['count'] for r in snapshot['requests'].values()),
+               'retries': sum(r['retries'] for r in snapshot['requests'].values()),
+               'megabytes': sum(r['bytes'] for r in snapshot['requests'].values()) / 2**20}
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='haver', description="Command-line interface to the Haver View API.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    mirror_parser = commands.add_parser('mirror', help="Download databases and series into a local columnar store.",
+                                        description="Download databases and series into a local columnar store. "
+                                                    "Interrupted runs resume where they stopped.")
+    mirror_parser.add_argument('targets', nargs='*', help="Databases, e.g. EUDATA, and Haver codes, e.g. N997CE@EUDATA.")
+    mirror_parser.add_argument('--path', required=True, help="Root directory of the store.")
+    mirror_parser.add_argument('--codes-file', help="File with one database or Haver code per line.")
+    mirror_parser.add_argument('--format', default='parquet', choices=['parquet', 'ipc'], help="Format of the store.")
+    mirror_parser.add_argument('--workers', type=int, default=8, help="Maximum number of concurrent requests.")
+    mirror_parser.add_argument('--chunk-size', type=int, default=500, help="Number of series written at a time.")
+    mirror_parser.add_argument('--errors', default='warn', choices=['raise', 'warn', 'ignore'],
+                               help="With 'raise', stop at the first failed series; otherwise skip failed series.")
+    mirror_parser.add_argument('--restart', action='store_true', help="Discard an unfinished run with different targets.")
+    mirror_parser.add_argument('--api-key', help="Haver API key. Defaults to the environment variable HAVER_API_KEY.")
+    mirror_parser.add_argument('--base-url', help="Base URL of the API.")
+    mirror_parser.add_argument('--quiet', action='store_true', help="Only print the final statistics.")
+    args = parser.parse_args(argv)
+
+    targets = list(args.targets)
+    if args.codes_file:
+        with open(os.path.expanduser(args.codes_file)) as f:
+            targets += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    if not targets:
+        parser.error("no databases or Haver codes to mirror")
+
+    with Haver(api_key=args.api_key, base_url=args.base_url, lazy=True,
+               pool_maxsize=max(args.workers, 10)) as haver:
+        try:
+            summary = mirror(haver, targets, args.path, format=args.format, max_workers=args.workers,
+                             chunk_size=args.chunk_size, errors=args.errors, restart=args.restart,
+                             log=None if args.quiet else sys.stderr)
+        except (HaverAPIError, ValueError) as e:
+            print(f"haver mirror: error: {e}", file=sys.stderr)
+            return 1
+    print(f"Mirrored {summary['series']} series ({summary['rows']} rows) in {summary['seconds']:.1f}s: "
+          f"{summary['series_per_second']:.1f} series/s, {summary['rows_per_second']:.0f} rows/s, "
+          f"{summary['requests']} requests, {summary['retries']} retries, {summary['megabytes']:.1f} MB"
+          + (f", {summary['resumed']} series resumed from checkpoint" if summary['resumed'] else '')
+          + (f", {len(summary['failed'])} failed" if summary['failed'] else ''))
+    return 0
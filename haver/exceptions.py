@@ -0,0 +1,28 @@
+"""  Created on 18/10/2026::
+------------- exceptions.py -------------
+
+**Authors**: L. Mingarelli
+"""
+
+from typing import Optional
+
+
+class HaverAPIError(Exception):
+    """Raised when a request to the Haver API fails.
+
+    Attributes:
+        status_code: HTTP status code of the response, if any.
+        url: URL of the failed request.
+    """
+    def __init__(self, message: str, status_code: Optional[int] = None, url: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.url = url
+
+
+class CircuitOpenError(HaverAPIError):
+    """Raised without sending the request while the circuit breaker is open."""
+
+
+class HaverAuthError(HaverAPIError):
+    """Raised when the API rejects the API key (status 401 or 403)."""
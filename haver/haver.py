@@ -7,19 +7,200 @@ DOCS at https://api.haverview.com/v4/docs
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from haver.haver_maps import (HAVER_CODE_POSITION, ALPHA2_CATEGORIES, ALPHA2_CODES, NAME_CATEGORIES, NAME_CODES,
+                              ALPHA2_TO_HAVER)
+from haver.cache import SeriesCache
+from haver.catalog import SeriesCatalog
+from haver.sync import SyncState
+from haver.scheduler import RetryPolicy, RateLimiter, CircuitBreaker
+from haver.exceptions import HaverAPIError, HaverAuthError, CircuitOpenError
+from haver.instrumentation import Instrumentation
+from haver.coalescing import SingleFlight, TTLCache
+from haver.http_cache import HTTPCache
+from haver.store import write_store, load_store
+
+import hashlib, os, time, warnings, datetime
+from collections.abc import Iterable
+from typing import Optional, Union, Dict, List, Tuple, Iterator, TYPE_CHECKING
+from itertools import islice
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+from concurrent.futures import ThreadPoolExecutor
+if TYPE_CHECKING:
+    # numpy and pandas are imported on first use, to keep `import haver` fast
+    import numpy as np
+    import pandas as pd
+
+# Errors of requests which may succeed when retried
+_TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout,
+                     requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+
+_LONG_COLUMNS = ['date', 'country', 'country_alpha2', 'country_name', 'database', 'variable', 'value']
+
+
+def _repeat_categorical(values: list, lengths: 'np.ndarray') -> 'pd.Categorical':
+    """Broadcasts one value per series to all of its rows, as a categorical."""
+    import numpy as np
+    import pandas as pd
+    categorical = pd.Categorical(values)
+    return pd.Categorical.from_codes(np.repeat(categorical.codes, lengths),
+                                     categories=categorical.categories)
+
+
+def _series_arrays(content_json: Dict) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Decodes the `dataPoints` of a series into contiguous `datetime64[D]` and `float64` arrays."""
+    import numpy as np
+    data_points = content_json['dataPoints']
+    dates = np.array([dp['date'][:10] for dp in data_points], dtype='datetime64[D]')
+    values = np.array([dp['nSeriesData'] for dp in data_points], dtype=np.float64)
+    return dates, values
+
+
+def _date_key(date: Union[str, datetime.date, None]) -> Optional[str]:
+    """Normalises `date` into the `YYYY-MM-DD` form of the `date` field of data points."""
+    if date is None:
+        return None
+    if isinstance(date, datetime.date):
+        return date.strftime('%Y-%m-%d')
+    try:
+        return datetime.datetime.strptime(str(date)[:10], '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"Dates must be `datetime.date` objects or ISO strings `YYYY-MM-DD`, instead '{date}' was passed.")
+
+
+def _window(start: Union[str, datetime.date, None] = None,
+            end: Union[str, datetime.date, None] = None,
+            last_n: Optional[int] = None) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    """Validates a date window, returning `start` and `end` as `YYYY-MM-DD` strings."""
+    if last_n is not None and (not isinstance(last_n, int) or last_n < 0):
+        raise ValueError(f"The argument 'last_n' must be a non-negative integer, instead {last_n} was passed.")
+    return _date_key(start), _date_key(end), last_n
+
+
+def _trim_series(content_json: Dict,
+                 start: Union[str, datetime.date, None] = None,
+                 end: Union[str, datetime.date, None] = None,
+                 last_n: Optional[int] = None) -> Dict:
+    """Restricts the `dataPoints` of a series to the dates within `[start, end]`, and then to the last `last_n` ones.
+
+    The payload is not modified in place, as it may be shared with caches or concurrent callers:
+    a shallow copy with the trimmed data points is returned instead.
+    """
+    if (start is None and end is None and last_n is None) or 'dataPoints' not in content_json:
+        return content_json
+    start, end, last_n = _window(start=start, end=end, last_n=last_n)
+    data_points = [dp for dp in content_json['dataPoints']
+                   if (start is None or dp['date'][:10] >= start) and (end is None or dp['date'][:10] <= end)]
+    if last_n is not None:
+        data_points = data_points[-last_n:] if last_n else []
+    return {**content_json, 'dataPoints': data_points}
 
-from haver.haver_maps import HAVER_COUNTRIES
 
-import os, warnings
-import pandas as pd
-from collections.abc import Iterable
-from typing import Optional, Union, Dict
-from functools import lru_cache
+def _country_columns(countries: 'pd.Categorical') -> Dict[str, 'pd.Categorical']:
+    """Maps a categorical of Haver country codes to ISO2 codes and country names, joining on the lookup tables.
+
+    Only the distinct country codes are looked up; rows are then mapped at once through their categorical codes.
+    """
+    import numpy as np
+    import pandas as pd
+    positions = np.fromiter((HAVER_CODE_POSITION.get(country, -1) for country in countries.categories),
+                            dtype=np.int64, count=len(countries.categories))
+    # Missing countries (code -1) and unknown ones (position -1) both pick the sentinel, mapping to -1
+    rows = np.append(positions, -1)[countries.codes]
+    return {column: pd.Categorical.from_codes(np.asarray(codes, dtype=np.int64)[rows],
+                                              categories=categories).remove_unused_categories()
+            for column, codes, categories in (('country_alpha2', ALPHA2_CODES, ALPHA2_CATEGORIES),
+                                              ('country_name', NAME_CODES, NAME_CATEGORIES))}
+
+
+def _frame_from_json(results: List[Tuple[str, Dict]], wide: bool = False,
+                     metadata: Tuple[str, ...] = ()) -> 'pd.DataFrame':
+    """Builds a DataFrame from `(haver_code, content_json)` pairs in a single pass.
+
+    Data points and metadata are first collected into flat arrays, and the frame is
+    assembled once at the end, so that the cost is linear in the total number of rows.
+    Fields of the series metadata listed in `metadata` are appended to the long frame as categorical columns.
+    """
+    import numpy as np
+    import pandas as pd
+    arrays = [_series_arrays(content_json) for _, content_json in results]
+    lengths = np.fromiter((len(dates) for dates, _ in arrays), dtype=np.int64, count=len(arrays))
+    dates = np.concatenate([dates for dates, _ in arrays]) if arrays else np.array([], dtype='datetime64[D]')
+    values = np.concatenate([values for _, values in arrays]) if arrays else np.array([], dtype=np.float64)
+
+    if wide:
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        df = pd.DataFrame({haver_code: pd.Series(values[i:j], index=pd.DatetimeIndex(dates[i:j]))
+                           for (haver_code, _), i, j in zip(results, offsets[:-1], offsets[1:])})
+        df.index.name = 'date'
+        return df.sort_index()
+
+    # mapping of Haver country codes with ISO2 country codes and country names
+    # https://www.haver.com/client/resources/geo-codes
+    countries = _repeat_categorical([content_json['geography'] for _, content_json in results], lengths)
+    return pd.DataFrame({'date': dates,
+                         'country': countries,
+                         **_country_columns(countries),
+                         'database': _repeat_categorical([haver_code.split(sep='@')[1].lower()
+                                                          for haver_code, _ in results], lengths),
+                         'variable': _repeat_categorical([content_json['name'].lower()
+                                                          for _, content_json in results], lengths),
+                         'value': values,
+                         **{key: _repeat_categorical([content_json.get(key) for _, content_json in results], lengths)
+                            for key in metadata}},
+                        columns=_LONG_COLUMNS + list(metadata))
+
 
 class Haver:
     """Implementation of the Haver View REST API.
+
+    All requests go through a single pooled `requests.Session`, so that TCP and TLS
+    connections to the API are kept alive and reused across calls.
+
+    Args:
+        api_key: Personal access API key. Defaults to the environment variable `HAVER_API_KEY`.
+        verify: Passed to `requests`; either a boolean or a path to a CA bundle.
+        proxies: Passed to `requests`; a dictionary mapping protocol to proxy URL.
+        request_kwargs: Additional keyword arguments passed to every request.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept alive per host.
+        pool_block: If `True`, block when no connection is free instead of opening a non-persistent one.
+        timeout: Request timeout in seconds, or a `(connect, read)` tuple.
+        cache: Optional persistent series cache, either a `haver.cache.SeriesCache` or a path to its file.
+               Cached series are served by `read` and `read_df` as long as their `datetimeLastModified`
+               has not changed since they were stored.
+        catalog: Optional local series catalog, either a `haver.catalog.SeriesCatalog` or a path to its file.
+                 `get_series` is answered from the catalog for all databases synced into it.
+        retry: A `haver.scheduler.RetryPolicy`, or the maximum number of retries. By default, failed
+               connections and 429 and 5xx responses are retried up to 3 times with exponential backoff
+               and jitter, honouring `Retry-After` headers.
+        rate_limit: A `haver.scheduler.RateLimiter`, or a maximum number of requests per second.
+        circuit_breaker: Optional `haver.scheduler.CircuitBreaker`, failing fast while the API is down.
+        lazy: If `True`, the API key is not validated on construction, but by the first request,
+              which raises `haver.HaverAuthError` if the key is invalid.
+        auth_ttl: Seconds for which the outcome of the last authentication check is cached by `_is_connected`.
+        hooks: Instrumentation hooks, e.g. a `haver.instrumentation.StatsCollector`,
+               notified of each request, processing stage and cache lookup. See `haver.instrumentation.Instrumentation`.
+        base_url: Root URL of the API. Defaults to `https://api.haverview.com`.
+        response_ttl: Seconds for which parsed responses are kept in memory and reused by identical requests.
+                      Default is `0`, disabling the cache. Identical concurrent requests share a single
+                      in-flight call regardless. Cached responses are shared, and should not be modified.
+        response_cache_size: Maximum number of responses kept in memory when `response_ttl > 0`.
+        http_cache: Optional persistent HTTP cache of the metadata endpoints used by `get_databases`, `database_info`,
+                    `recessions` and `search`, either a `haver.http_cache.HTTPCache` or a path to its file.
+                    Stored responses are revalidated with conditional requests, and served on `304 Not Modified`.
+
+    Examples:
+        >>> from haver import Haver
+        >>> with Haver(api_key='<your-api-key>', pool_maxsize=16, timeout=30) as haver:
+        ...     haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'])
     """
     _HAVER_URL = 'https://api.haverview.com'
+    _COUNTRY_INDEX_TTL = 3600.
     __NO_APIKEY_WARNING = """
     Invalid or Expired Haver api_key.
     Please set as environment variable `HAVER_API_KEY` or initialise haver as  Haver(api_key='<your-api-key>').
@@ -27,7 +208,46 @@ class Haver:
 
     def __init__(self, api_key: Optional[str] = None,
                  verify=None, proxies=None,
-                 request_kwargs: Union[Dict, None] = None):
+                 request_kwargs: Union[Dict, None] = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 timeout: Union[float, Tuple[float, float], None] = None,
+                 cache: Union[SeriesCache, str, None] = None,
+                 catalog: Union[SeriesCatalog, str, None] = None,
+                 retry: Union[RetryPolicy, int, None] = None,
+                 rate_limit: Union[RateLimiter, float, None] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 lazy: bool = False,
+                 auth_ttl: float = 300.,
+                 hooks: Optional[Iterable] = None,
+                 base_url: Optional[str] = None,
+                 response_ttl: float = 0.,
+                 response_cache_size: int = 1024,
+                 http_cache: Union[HTTPCache, str, None] = None):
+        self.__config = dict(verify=verify, proxies=proxies, request_kwargs=request_kwargs,
+                             pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                             pool_block=pool_block, timeout=timeout, cache=cache, catalog=catalog,
+                             retry=retry, rate_limit=rate_limit, circuit_breaker=circuit_breaker,
+                             lazy=lazy, auth_ttl=auth_ttl, hooks=hooks, base_url=base_url,
+                             response_ttl=response_ttl, response_cache_size=response_cache_size,
+                             http_cache=http_cache)
+        if base_url:
+            self._HAVER_URL = base_url.rstrip('/')
+        self._timeout = timeout
+        self._auth_ttl = auth_ttl
+        self.__auth_checked = None
+        self._retry = retry if isinstance(retry, RetryPolicy) else RetryPolicy(**({} if retry is None else dict(max_retries=retry)))
+        self._rate_limiter = rate_limit if isinstance(rate_limit, RateLimiter) else RateLimiter(rate=rate_limit)
+        self._circuit_breaker = circuit_breaker
+        self._instrumentation = Instrumentation(hooks)
+        self._single_flight = SingleFlight()
+        self._response_cache = TTLCache(ttl=response_ttl, maxsize=response_cache_size) if response_ttl > 0 else None
+        self._country_indices = TTLCache(ttl=self._COUNTRY_INDEX_TTL, maxsize=64)
+        self._cache = SeriesCache(cache) if isinstance(cache, str) else cache
+        self._catalog = SeriesCatalog(catalog) if isinstance(catalog, str) else catalog
+        self._http_cache = HTTPCache(http_cache) if isinstance(http_cache, str) else http_cache
+        self._session = self.__make_session(pool_connections=pool_connections,
+                                            pool_maxsize=pool_maxsize,
+                                            pool_block=pool_block)
         self.__is_active = False
         self._headers = None
         self._request_kwargs = dict(headers=self._headers)
@@ -40,9 +260,155 @@ class Haver:
         self.__api_key = None
         self.__api_key = api_key or self._get_apikey()
         if self.__api_key:
-            self.__is_active = self.__test_connection(api_key=api_key)
-
+            if lazy:
+                self._headers = self.__make_headers(api_key=self.__api_key)
+                self._request_kwargs = self.__make__request_kwargs(headers=self._headers)
+            else:
+                self.__is_active = self.__test_connection(api_key=self.__api_key)
+
+
+
+    @staticmethod
+    def __make_session(pool_connections, pool_maxsize, pool_block):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        kwargs = {'timeout': self._timeout, **self._request_kwargs, **kwargs}
+        started, attempt = time.perf_counter(), 0
+        while True:
+            try:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.before_request(url)
+                with self._rate_limiter:
+                    response = self._session.get(url, **kwargs)
+            except CircuitOpenError as e:
+                self._instrumentation.request(url, None, 0, started, attempt, error=e)
+                raise
+            except _TRANSIENT_ERRORS as e:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_failure()
+                if attempt >= self._retry.max_retries:
+                    error = HaverAPIError(f"Request to {url} failed: {e!r}", url=url)
+                    self._instrumentation.request(url, None, 0, started, attempt, error=error)
+                    raise error from e
+                retry_after = None
+            except requests.RequestException as e:
+                # Invalid URLs, schemas, headers or proxies: retrying cannot help, and the API is not at fault
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.release_trial()
+                error = HaverAPIError(f"Request to {url} failed: {e!r}", url=url)
+                self._instrumentation.request(url, None, 0, started, attempt, error=error)
+                raise error from e
+            except BaseException:
+                # No exception may leave a trial request of the circuit breaker pending
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.release_trial()
+                raise
+            else:
+                if self._circuit_breaker is not None:
+                    if response.status_code >= 500:
+                        self._circuit_breaker.record_failure()
+                    else:
+                        self._circuit_breaker.record_success()
+                if response.status_code not in self._retry.retry_statuses or attempt >= self._retry.max_retries:
+                    self._instrumentation.request(url, response.status_code, len(response.content), started, attempt)
+                    return response
+                retry_after = response.headers.get('Retry-After')
+            time.sleep(self._retry.delay(attempt, retry_after))
+            attempt += 1
+
+    def _get_json(self, url: str, conditional: bool = False):
+        """Returns the parsed response to `url`. If `conditional`, the response is served through the HTTP cache."""
+        if self._response_cache is not None:
+            content_json = self._response_cache.get(url)
+            self._instrumentation.cache('response_cache', content_json is not None)
+            if content_json is not None:
+                return content_json
+        fetch = self.__fetch_conditional if conditional and self._http_cache is not None else self.__fetch_json
+
+        def _fetch():
+            # The response is cached before the in-flight call is released, and the cache checked again
+            # once the call is acquired, so that a caller arriving in between does not send a duplicate request
+            if self._response_cache is not None:
+                cached = self._response_cache.get(url)
+                if cached is not None:
+                    return cached
+            content_json = fetch(url)
+            if self._response_cache is not None:
+                self._response_cache.set(url, content_json)
+            return content_json
+
+        content_json, shared = self._single_flight.do(url, _fetch)
+        self._instrumentation.cache('single_flight', shared)
+        return content_json
 
+    def __fetch_json(self, url: str):
+        response = self._get(url)
+        self.__check_response(response, url)
+        with self._instrumentation.stage('decode'):
+            return _loads(response.content)
+
+    def __fetch_conditional(self, url: str):
+        # Responses may depend on the entitlements of the API key, which is therefore part of the cache key
+        key = f"{hashlib.sha256((self.__api_key or '').encode()).hexdigest()[:16]} {url}"
+        cached = self._http_cache.get(key, url)
+        if cached is not None and cached.fresh:
+            content = cached.content
+        else:
+            headers = {**(self._request_kwargs.get('headers') or {}), **(cached.validators if cached else {})}
+            response = self._get(url, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                self._http_cache.refresh(key)
+                content = cached.content
+            else:
+                self.__check_response(response, url)
+                content = response.content
+                self._http_cache.put(key, content, etag=response.headers.get('ETag'),
+                                     last_modified=response.headers.get('Last-Modified'))
+                cached = None
+        self._instrumentation.cache('http_cache', cached is not None)
+        with self._instrumentation.stage('decode'):
+            return _loads(content)
+
+    def __check_response(self, response: requests.Response, url: str):
+        if response.status_code in (401, 403):
+            self.__auth_checked = (False, time.monotonic())
+            raise HaverAuthError(self.__NO_APIKEY_WARNING.strip(), status_code=response.status_code, url=url)
+        self.__auth_checked = (True, time.monotonic())
+        if response.status_code >= 400:
+            raise HaverAPIError(f"Request to {url} failed with status {response.status_code}: {response.text[:200]}",
+                                status_code=response.status_code, url=url)
+
+    def add_hook(self, hook):
+        """Registers an instrumentation hook. See `haver.instrumentation.Instrumentation`."""
+        self._instrumentation.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Unregisters an instrumentation hook previously registered with `add_hook`."""
+        self._instrumentation.hooks.remove(hook)
+
+    def close(self):
+        """Closes the underlying session and all pooled connections, and any cache or catalog opened from a path."""
+        self._session.close()
+        self._country_indices.clear()
+        if isinstance(self.__config['cache'], str):
+            self._cache.close()
+        if isinstance(self.__config['catalog'], str):
+            self._catalog.close()
+        if isinstance(self.__config['http_cache'], str):
+            self._http_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def __make_headers(self, api_key):
         return {'Content-Type': 'application/json',
@@ -55,13 +421,14 @@ class Haver:
         _headers = self.__make_headers(api_key=api_key)
         _request_kwargs = self.__make__request_kwargs(headers=_headers)
         try:
-            _active = requests.get('https://api.haverview.com/v4/docs',
-                                   **_request_kwargs).status_code == 200
+            _active = self._session.get(f'{self._HAVER_URL}/v4/docs',
+                                        **{'timeout': self._timeout, **_request_kwargs}).status_code == 200
         except:
             _active = False
         if _active:
             self._headers = _headers
             self._request_kwargs = _request_kwargs
+        self.__auth_checked = (_active, time.monotonic())
 
         return _active
 
@@ -71,7 +438,8 @@ class Haver:
         Args:
             api_key: Personal access API key.
         """
-        self.__init__(api_key=api_key)
+        self.close()
+        self.__init__(api_key=api_key, **self.__config)
         if not self._is_connected:
             warnings.warn(self.__NO_APIKEY_WARNING)
 
@@ -87,6 +455,8 @@ class Haver:
 
     @property
     def _is_connected(self):
+        if self.__auth_checked is not None and time.monotonic() - self.__auth_checked[1] < self._auth_ttl:
+            return self.__auth_checked[0]
         return self.__test_connection(api_key=self._get_apikey())
 
     def get_databases(self) -> Dict:
@@ -100,8 +470,10 @@ class Haver:
             >>> import haver
             >>> haver.get_databases()
         """
-        dbs = requests.get(f'{self._HAVER_URL}/v4/database?&per_page=1000', **self._request_kwargs).json()
-        return {db['name']: db['description'] for db in dbs}
+        return {db['name']: db['description'] for db in self._list_databases()}
+
+    def _list_databases(self) -> List[Dict]:
+        return self._get_json(f'{self._HAVER_URL}/v4/database?&per_page=1000', conditional=True)
 
     def database_info(self, database: str) -> Dict:
         """
@@ -117,9 +489,8 @@ class Haver:
             >>> import haver
             >>> haver.database_info('USECON')
         """
-        return requests.get(f'{self._HAVER_URL}/v4/database/{database}/series?&per_page=1', **self._request_kwargs).json()['data'][0]
+        return self._get_json(f'{self._HAVER_URL}/v4/database/{database}/series?&per_page=1', conditional=True)['data'][0]
 
-    @lru_cache
     def get_series(self, database: str,
                    like: Union[str, None] = None,
                    full_info: bool = False):
@@ -137,27 +508,38 @@ class Haver:
             >>> import haver
             >>> haver.get_series(database='USECON', limit=2, full_info=True)
         """
-        def _get_series_page(page=None):
-            series = requests.get(
-                f"{self._HAVER_URL}/v4/database/{database}/series?{f'&page={page}' if page else ''}&per_page=1000",
-                **self._request_kwargs).json()['data']
-            return series
+        if self._catalog is not None:
+            in_catalog = database in self._catalog
+            self._instrumentation.cache('catalog', in_catalog)
+            if in_catalog:
+                return self._catalog.get_series(database, like=like, full_info=full_info)
+
         if like:
-            series = _get_series_page(page=like)
+            series = self._get_series_page(database, page=like)
         else:
-            series = _get_series_page()
-            add_series = [series]
-            while len(series)==1000:
-                page = series[-1]['name']
-                series = _get_series_page(page=page)
-                # print(page)
-                add_series.append([s for s in series if s['name']!=page])
-            series = sum(add_series, [])
+            with self._instrumentation.stage('get_series.paginate'):
+                series = self._list_series(database)
 
         if not full_info:
             series = {s['name']: s['description'] for s in series}
         return series
 
+    def _get_series_page(self, database: str, page: Optional[str] = None) -> List[Dict]:
+        return self._get_json(
+            f"{self._HAVER_URL}/v4/database/{database}/series?{f'&page={page}' if page else ''}&per_page=1000")['data']
+
+    def _iter_series_pages(self, database: str) -> Iterator[List[Dict]]:
+        """Yields the full metadata of all series in `database`, one page of up to 1000 series at a time."""
+        series = self._get_series_page(database)
+        yield series
+        while len(series)==1000:
+            page = series[-1]['name']
+            series = self._get_series_page(database, page=page)
+            yield [s for s in series if s['name']!=page]
+
+    def _list_series(self, database: str) -> List[Dict]:
+        return [s for page in self._iter_series_pages(database) for s in page]
+
     def search(self, query: str):
         """
         Returns a list of all series with the specified keywords in their name,
@@ -171,23 +553,79 @@ class Haver:
             >>> import haver
             >>> haver.search(query='employment')
         """
-        search_res = requests.get(f"{self._HAVER_URL}/v4/data/search?query={query}",
-                             **self._request_kwargs).json()
+        search_res = self._get_json(f"{self._HAVER_URL}/v4/data/search?query={query}", conditional=True)
         return search_res
 
-    def recessions(self) -> pd.DataFrame:
+    def series_for_country(self, alpha2: str,
+                           databases: Union[str, Iterable[str], None] = None) -> List[str]:
+        """Returns the Haver codes of all series whose `geography` or `geography2` is the country `alpha2`.
+
+        Series are looked up in an index of the series metadata by Haver country code, which is built
+        per database and kept for an hour, or answered by the local catalog for databases synced into it.
+
+        Args:
+            alpha2: ISO2 country code, e.g. `'DE'`.
+            databases: A database name, or a list of them. Default is all databases available.
+
+        Returns:
+            List of Haver codes `{series}@{database}`.
+
+        Examples:
+            >>> import haver
+            >>> haver.series_for_country('DE', databases=['EUDATA', 'G10'])
+        """
+        geographies = ALPHA2_TO_HAVER.get(alpha2.upper()) if isinstance(alpha2, str) else None
+        if geographies is None:
+            raise ValueError(f"The argument 'alpha2' must be an ISO2 country code, instead '{alpha2}' was passed.")
+        if databases is None:
+            databases = list(self.get_databases())
+        elif isinstance(databases, str):
+            databases = [databases]
+
+        haver_codes = []
+        for database in databases:
+            if self._catalog is not None and database in self._catalog:
+                names = [s['name'] for s in self._catalog.search(database=database, geography=geographies)]
+            else:
+                index = self._country_index(database)
+                names = list(dict.fromkeys(name for geography in geographies for name in index.get(geography, ())))
+            haver_codes.extend(f'{name}@{database}' for name in names)
+        return haver_codes
+
+    def _country_index(self, database: str) -> Dict[str, List[str]]:
+        """Index of the series of `database` by Haver country code, over both `geography` and `geography2`.
+
+        Indices are kept for `_COUNTRY_INDEX_TTL` seconds, after which the series of `database` are listed again.
+        """
+        index = self._country_indices.get(database.upper())
+        if index is None:
+            index = {}
+            for s in self._list_series(database):
+                for geography in dict.fromkeys((s.get('geography'), s.get('geography2'))):
+                    if geography:
+                        index.setdefault(geography, []).append(s['name'])
+            self._country_indices.set(database.upper(), index)
+        return index
+
+    def recessions(self) -> 'pd.DataFrame':
         """
         Returns all available recessions with associated start and end dates, and country.
         """
-        rec = requests.get(f"{self._HAVER_URL}/v4/data/recessions?&per_page=1000",
-                      **self._request_kwargs).json()['data']
+        import pandas as pd
+        rec = self._get_json(f"{self._HAVER_URL}/v4/data/recessions?&per_page=1000", conditional=True)['data']
         return pd.DataFrame(rec).drop(columns='index')
 
-    def read(self, database: str, series: str) -> Dict:
+    def read(self, database: str, series: str,
+             start: Union[str, datetime.date, None] = None,
+             end: Union[str, datetime.date, None] = None,
+             last_n: Optional[int] = None) -> Dict:
         """
         Args:
             database: An Haver database.
             series: A Haver series available within `database`.
+            start: If provided, only observations dated on or after `start` are returned.
+            end: If provided, only observations dated on or before `end` are returned.
+            last_n: If provided, only the last `last_n` observations (within `start` and `end`) are returned.
 
         Returns:
             Dict
@@ -195,25 +633,129 @@ class Haver:
         Examples:
             >>> import haver
             >>> haver.read(database='EUDATA', series='N997CE')
+            >>> haver.read(database='EUDATA', series='N997CE', start='2020-01-01')
+            >>> haver.read(database='EUDATA', series='N997CE', last_n=4)
         """
 
         if not isinstance(series, str):
             raise ValueError(f"The argument 'haver_codes' must be a string, instead {type(series)} was passed.")
         if not isinstance(database, str):
             raise ValueError(f"The argument 'haver_codes' must be a string, instead {type(database)} was passed.")
+        _window(start=start, end=end, last_n=last_n)
+
+        if self._cache is not None:
+            cached = self._cache.get(database, series)
+            if cached is not None:
+                content_json, last_modified = cached
+                if last_modified is not None and last_modified == self._last_modified(database, series):
+                    self._instrumentation.cache('series_cache', True)
+                    return _trim_series(content_json, start=start, end=end, last_n=last_n)
+            self._instrumentation.cache('series_cache', False)
 
         # Put the URL for the Haver View API call together
         API_URL = f'{self._HAVER_URL}/v4/database/{database}/series/{series}'
 
         # Run the API call and get content in JSON format
-        content_json = requests.get(API_URL, **self._request_kwargs).json()
-        return content_json
+        content_json = self._get_json(API_URL)
+        if self._cache is not None and 'dataPoints' in content_json:
+            last_modified = content_json.get('datetimeLastModified') or self._last_modified(database, series)
+            self._cache.put(database, series, content_json, last_modified)
+        # The v4 API offers no date filter on series, so that windows are applied to the full history
+        return _trim_series(content_json, start=start, end=end, last_n=last_n)
+
+    def _last_modified(self, database: str, series: str) -> Optional[str]:
+        """Returns the `datetimeLastModified` of a series from a single-row metadata query."""
+        data = self._get_json(f'{self._HAVER_URL}/v4/database/{database}/series?&page={series}&per_page=1').get('data')
+        if data and data[0]['name'].upper() == series.upper():
+            return data[0].get('datetimeLastModified')
+
+    def read_arrays(self, database: str, series: str, **window) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Reads a series as a pair of contiguous NumPy arrays.
+
+        Args:
+            database: An Haver database.
+            series: A Haver series available within `database`.
+            **window: `start`, `end` and `last_n`, as in `read`.
+
+        Returns:
+            Tuple of `datetime64[D]` dates and `float64` values, with missing observations as `NaN`.
+
+        Examples:
+            >>> import haver
+            >>> dates, values = haver.read_arrays(database='EUDATA', series='N997CE')
+        """
+        return _series_arrays(self.read(database=database, series=series, **window))
+
+    def _read_many(self, haver_codes: list,
+                   max_workers: int = 1,
+                   errors: str = 'raise',
+                   **window) -> Tuple[List, Dict]:
+        """Reads `haver_codes` with at most `max_workers` requests in flight, restricted to `window` as in `read`.
+
+        Returns a list of `(haver_code, content_json)` pairs in input order, with
+        `content_json=None` for failed codes, and a dictionary of per-code exceptions.
+        """
+        if errors not in ('raise', 'warn', 'ignore'):
+            raise ValueError(f"The argument 'errors' must be one of 'raise', 'warn' or 'ignore', instead '{errors}' was passed.")
+        _window(**window)
+
+        def _fetch(haver_code):
+            series, database = haver_code.split(sep='@')
+            content_json = self.read(database=database, series=series, **window)
+            if 'dataPoints' not in content_json:
+                raise ValueError(f"No data returned for '{haver_code}': {content_json}")
+            return content_json
+
+        # Each distinct code is only read once
+        unique_codes = list(dict.fromkeys(haver_codes))
+        if max_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            futures = {haver_code: executor.submit(_fetch, haver_code) for haver_code in unique_codes}
+        else:
+            executor, futures = None, None
 
-    def read_df(self, haver_codes: list) -> pd.DataFrame:
+        outcomes, failed = {}, {}
+        try:
+            for haver_code in unique_codes:
+                try:
+                    outcomes[haver_code] = futures[haver_code].result() if futures else _fetch(haver_code)
+                except Exception as e:
+                    if errors == 'raise':
+                        raise
+                    if errors == 'warn':
+                        warnings.warn(f"Failed to read '{haver_code}': {e!r}")
+                    outcomes[haver_code], failed[haver_code] = None, e
+        finally:
+            if executor is not None:
+                for future in futures.values():
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+        results = [(haver_code, outcomes[haver_code]) for haver_code in haver_codes]
+        return results, failed
+
+    def read_df(self, haver_codes: list,
+                max_workers: int = 1,
+                errors: str = 'raise',
+                wide: bool = False,
+                start: Union[str, datetime.date, None] = None,
+                end: Union[str, datetime.date, None] = None,
+                last_n: Optional[int] = None) -> 'pd.DataFrame':
         """
 
         Args:
             haver_codes: A list of haver codes constructed as `{series}@{database}`
+            max_workers: Maximum number of concurrent requests. Default is `1`, fetching series sequentially.
+                         For best results do not exceed the `pool_maxsize` of the session.
+            errors: One of `'raise'` (default), `'warn'` or `'ignore'`. If not `'raise'`, codes which
+                    fail to be read are skipped, and the corresponding exceptions are reported in the
+                    dictionary `df.attrs['errors']`.
+            wide: If `False` (default), returns a long DataFrame with columns date, country, country_alpha2,
+                  country_name, database, variable and value. If `True`, returns instead a date × series
+                  matrix, with one column per Haver code.
+            start: If provided, only observations dated on or after `start` are returned.
+            end: If provided, only observations dated on or before `end` are returned.
+            last_n: If provided, only the last `last_n` observations of each series are returned.
 
         Returns:
             pandas.DataFrame
@@ -221,41 +763,212 @@ class Haver:
         Examples:
             >>> import haver
             >>> haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'])
+            >>> haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'], max_workers=16, errors='warn')
+            >>> haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'], wide=True)
+            >>> haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'], start='2020-01-01', end='2023-12-31')
         """
 
         if not isinstance(haver_codes, Iterable) or isinstance(haver_codes, str):
             raise ValueError(
                 f"The argument 'haver_codes' should be a list-like iterable, instead {type(haver_codes)} was received.")
+        haver_codes = list(haver_codes)
 
-        # Loop through the list of Haver codes
-        df_final = pd.DataFrame()
-        for haver_code in haver_codes:
-            series, database = haver_code.split(sep='@')
+        with self._instrumentation.stage('read_df.fetch'):
+            results, failed = self._read_many(haver_codes, max_workers=max_workers, errors=errors,
+                                              start=start, end=end, last_n=last_n)
+        with self._instrumentation.stage('read_df.build'):
+            df_final = _frame_from_json([(haver_code, content_json) for haver_code, content_json in results
+                                         if content_json is not None], wide=wide)
+        df_final.attrs['errors'] = failed
 
-            content_json = self.read(database=database, series=series)
-            content_json_dp = content_json['dataPoints']
+        return df_final
 
-            # mapping of Haver country codes with ISO2 country codes and country names
-            # https://www.haver.com/client/resources/geo-codes
+    def iter_read(self, haver_codes: Iterable[str],
+                  chunk_size: int = 100,
+                  max_workers: int = 1,
+                  errors: str = 'raise',
+                  wide: bool = False,
+                  metadata: Tuple[str, ...] = (),
+                  sink=None,
+                  **window):
+        """Reads series in chunks of `chunk_size` codes, yielding one DataFrame per chunk.
 
-            # Create pandas dataframe
-            df = pd.DataFrame(content_json_dp).rename(columns={'nSeriesData': 'value'})
-            df['variable'] = content_json['name'].lower()
-            df['country'] = content_json['geography']
-            a2 = HAVER_COUNTRIES.get(content_json['geography'])
-            df['country_alpha2'] = a2['alpha2'] if a2 is not None else None
-            df['country_name'] = a2['name'] if a2 is not None else None
-            df['database'] = database.lower()
+        Codes are consumed lazily from `haver_codes`, which can be any iterable including a generator,
+        and each chunk is released once yielded, so that memory stays flat regardless of the number of series.
 
-            # Append to final dataframe
-            df_final = pd.concat([df_final, df])
+        Args:
+            haver_codes: An iterable of haver codes constructed as `{series}@{database}`
+            chunk_size: Number of series per chunk.
+            max_workers: Maximum number of concurrent requests within each chunk, as in `read_df`.
+            errors: One of `'raise'` (default), `'warn'` or `'ignore'`, as in `read_df`.
+                    Exceptions are reported per chunk in `df.attrs['errors']`.
+            wide: If `True`, each chunk is a date × series matrix instead of a long DataFrame.
+            metadata: Fields of the series metadata appended to long chunks as categorical columns, e.g. `('frequency',)`.
+            sink: Optional callable, or object with a `write` method, to which each chunk is passed.
+                  In this case chunks are not yielded: all chunks are consumed, and the total number of rows is returned.
+            **window: `start`, `end` and `last_n`, as in `read_df`.
 
-        # Rearrange columns
-        df_final = df_final[['date', 'country', 'country_alpha2',
-                             'country_name', 'database', 'variable', 'value']]
+        Returns:
+            Iterator of pandas.DataFrame, or the total number of rows passed to `sink`.
+
+        Examples:
+            >>> import haver
+            >>> for df in haver.iter_read(codes, chunk_size=500, max_workers=16):
+            ...     process(df)
+            >>> haver.iter_read(codes, sink=lambda df: df.to_csv('out.csv', mode='a', header=False))
+        """
+        if not isinstance(haver_codes, Iterable) or isinstance(haver_codes, str):
+            raise ValueError(
+                f"The argument 'haver_codes' should be a list-like iterable, instead {type(haver_codes)} was received.")
+        if chunk_size < 1:
+            raise ValueError(f"The argument 'chunk_size' should be a positive integer, instead {chunk_size} was received.")
+        chunks = self._iter_chunks(iter(haver_codes), chunk_size=chunk_size, max_workers=max_workers,
+                                   errors=errors, wide=wide, metadata=metadata, window=window)
+        if sink is None:
+            return chunks
+        write = getattr(sink, 'write', sink)
+        n_rows = 0
+        for df in chunks:
+            write(df)
+            n_rows += len(df)
+        return n_rows
+
+    def _iter_chunks(self, haver_codes: Iterator[str], chunk_size: int, max_workers: int,
+                     errors: str, wide: bool, metadata: Tuple[str, ...], window: Dict) -> Iterator['pd.DataFrame']:
+        while True:
+            chunk = list(islice(haver_codes, chunk_size))
+            if not chunk:
+                return
+            with self._instrumentation.stage('iter_read.fetch'):
+                results, failed = self._read_many(chunk, max_workers=max_workers, errors=errors, **window)
+            with self._instrumentation.stage('iter_read.build'):
+                df = _frame_from_json([(haver_code, content_json) for haver_code, content_json in results
+                                       if content_json is not None], wide=wide, metadata=metadata)
+            df.attrs['errors'] = failed
+            del results
+            yield df
+
+    def iter_database(self, database: str, chunk_size: int = 100, **kwargs):
+        """Streams all series of `database`, listing them page by page as they are read.
+
+        Args:
+            database: Name of the Haver database.
+            chunk_size: Number of series per chunk.
+            **kwargs: Passed to `iter_read`, e.g. `max_workers`, `errors`, `wide`, `metadata`, `sink` or `start`.
+
+        Returns:
+            Iterator of pandas.DataFrame, or the total number of rows passed to `sink`.
+
+        Examples:
+            >>> import haver
+            >>> for df in haver.iter_database('EUDATA', chunk_size=500, max_workers=16):
+            ...     process(df)
+        """
+        haver_codes = (f"{s['name']}@{database}" for page in self._iter_series_pages(database) for s in page)
+        return self.iter_read(haver_codes, chunk_size=chunk_size, **kwargs)
+
+    def sync(self, database: str,
+             since: Union[str, datetime.date, None] = None,
+             state: Union[SyncState, str, None] = None,
+             max_workers: int = 1,
+             errors: str = 'raise') -> Dict[str, Dict]:
+        """Fetches only the series of `database` which are new or changed.
+
+        The current metadata of all series in `database` is diffed against `state`
+        (`datetimeLastModified` and `dataPointCount`), and only new or changed series are read.
+        The state is then updated with the series successfully read.
+
+        Args:
+            database: Name of the Haver database.
+            since: If provided, only series with `datetimeLastModified` after `since` are considered changed.
+            state: A `haver.sync.SyncState`, or a path to its JSON file. If `None`, all series
+                   (modified after `since`, if provided) are considered changed.
+            max_workers: Maximum number of concurrent requests, as in `read_df`.
+            errors: One of `'raise'` (default), `'warn'` or `'ignore'`, as in `read_df`.
+                    Series which fail to be read are left out of the state, and retried on the next sync.
+
+        Returns:
+            Dict with keys the Haver codes `{series}@{database}` of the changed series and values their data, as returned by `read`.
+
+        Examples:
+            >>> import haver
+            >>> haver.sync('EUDATA', state='~/.haver/sync_state.json', max_workers=8)
+            >>> haver.sync('EUDATA', since='2024-01-31')
+        """
+        if isinstance(state, str):
+            state = SyncState(state)
+        since = None if since is None else _to_utc(since)
+
+        current = {s['name']: [s.get('datetimeLastModified'), s.get('dataPointCount')]
+                   for s in self._list_series(database)}
+        stored = state.get(database) if state is not None else {}
+        changed = [name for name, version in current.items()
+                   if stored.get(name) != version
+                   and (since is None or version[0] is None or _to_utc(version[0]) > since)]
+
+        results, failed = self._read_many([f'{name}@{database}' for name in changed],
+                                          max_workers=max_workers, errors=errors)
+        data = {haver_code: content_json for haver_code, content_json in results if content_json is not None}
+        if state is not None:
+            state.update(database, {haver_code.split(sep='@')[0]: current[haver_code.split(sep='@')[0]]
+                                    for haver_code in data},
+                         removed=[name for name in stored if name not in current])
+        return data
+
+    def export(self, haver_codes: list, path: str,
+               format: str = 'parquet',
+               mode: str = 'append',
+               max_workers: int = 1,
+               errors: str = 'raise'):
+        """Reads series and writes them to a columnar dataset partitioned by database and frequency.
+
+        Requires `pyarrow`. See `haver.store.write_store` for details on the layout.
+
+        Args:
+            haver_codes: A list of haver codes constructed as `{series}@{database}`
+            path: Root directory of the dataset.
+            format: Either `'parquet'` (default) or `'ipc'` (Arrow IPC, best suited to memory-mapped reads).
+            mode: Either `'append'` (default) or `'overwrite'`, replacing all partitions written to.
+            max_workers: Maximum number of concurrent requests, as in `read_df`.
+            errors: One of `'raise'` (default), `'warn'` or `'ignore'`, as in `read_df`.
+
+        Returns:
+            Dictionary of per-code exceptions for the codes which failed to be read.
+
+        Examples:
+            >>> import haver
+            >>> haver.export(['N997CE@EUDATA','N025CE@EUDATA'], path='~/haver_mirror', max_workers=8)
+            >>> haver.load('~/haver_mirror', haver_codes=['N997CE@EUDATA'], start='2020-01-01')
+        """
+        if not isinstance(haver_codes, Iterable) or isinstance(haver_codes, str):
+            raise ValueError(
+                f"The argument 'haver_codes' should be a list-like iterable, instead {type(haver_codes)} was received.")
+        results, failed = self._read_many(list(haver_codes), max_workers=max_workers, errors=errors)
+        df = _frame_from_json([(haver_code, content_json) for haver_code, content_json in results
+                               if content_json is not None], metadata=('frequency',))
+        write_store(df, os.path.expanduser(path), format=format, mode=mode)
+        return failed
+
+    @staticmethod
+    def load(path: str, haver_codes: Optional[list] = None, **kwargs):
+        """Loads series from a dataset written by `export`, with memory-mapped reads and predicate pushdown.
+
+        Args:
+            path: Root directory of the dataset.
+            haver_codes: Haver codes `{series}@{database}` to load. Default is all series.
+            **kwargs: Passed to `haver.store.load_store`, e.g. `columns`, `start`, `end`, `databases`, `frequencies`, `format`.
+
+        Returns:
+            pandas.DataFrame
+        """
+        return load_store(os.path.expanduser(path), haver_codes=haver_codes, **kwargs)
 
-        return df_final
 
+def _to_utc(timestamp: Union[str, datetime.date]) -> 'pd.Timestamp':
+    """Parses `timestamp` into a timezone-naive UTC `pandas.Timestamp`."""
+    import pandas as pd
+    timestamp = pd.Timestamp(timestamp)
+    return timestamp.tz_convert(None) if timestamp.tz is not None else timestamp
 
 
 if __name__ == '__main__':
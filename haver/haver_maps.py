@@ -117,3 +117,20 @@ HAVER_COUNTRIES = {code: {'alpha2': a2, 'name': name}
                                              'Zambia', 'Zimbabwe'))
                    }
 
+
+# Precomputed lookup table: each Haver country code has a position in `HAVER_CODES`,
+# and its ISO2 code and name are stored as categorical codes into `ALPHA2_CATEGORIES` and `NAME_CATEGORIES`.
+# The last position of the code arrays is a sentinel for unknown Haver codes, mapping to missing values (-1).
+HAVER_CODES = tuple(HAVER_COUNTRIES)
+HAVER_CODE_POSITION = {code: i for i, code in enumerate(HAVER_CODES)}
+ALPHA2_CATEGORIES = tuple(sorted({v['alpha2'] for v in HAVER_COUNTRIES.values()}))
+NAME_CATEGORIES = tuple(sorted({v['name'] for v in HAVER_COUNTRIES.values()}))
+ALPHA2_CODES = tuple(ALPHA2_CATEGORIES.index(HAVER_COUNTRIES[code]['alpha2']) for code in HAVER_CODES) + (-1,)
+NAME_CODES = tuple(NAME_CATEGORIES.index(HAVER_COUNTRIES[code]['name']) for code in HAVER_CODES) + (-1,)
+
+# Reverse index of ISO2 codes to the Haver country codes mapped to them
+ALPHA2_TO_HAVER = {}
+for _code, _country in HAVER_COUNTRIES.items():
+    ALPHA2_TO_HAVER.setdefault(_country['alpha2'], []).append(_code)
+ALPHA2_TO_HAVER = {a2: tuple(codes) for a2, codes in ALPHA2_TO_HAVER.items()}
+del _code, _country
@@ -0,0 +1,107 @@
+"""  Created on 18/10/2026::
+------------- http_cache.py -------------
+
+**Authors**: L. Mingarelli
+"""
+
+import os, sqlite3, threading, time, zlib
+from typing import Optional, Union, Dict, NamedTuple
+
+from haver.instrumentation import _endpoint
+
+
+class CachedResponse(NamedTuple):
+    """A response body stored by `HTTPCache`, with its validators."""
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh: bool
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Headers making a request conditional on the stored response having changed."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """Persistent HTTP cache of the metadata endpoints of the API, i.e. the responses of `Haver.get_databases`,
+    `Haver.database_info`, `Haver.recessions` and `Haver.search`.
+
+    Responses are stored in a SQLite file together with their `ETag` and `Last-Modified` validators.
+    Within its time to live a response is served without any request; afterwards the request is sent
+    with `If-None-Match` / `If-Modified-Since` headers, and a `304 Not Modified` reply is served from the store.
+    The file can be shared by several processes on the same host, which then share one warm cache.
+
+    Args:
+        path: Path to the SQLite file backing the cache. It is created if it does not exist.
+        ttl: Seconds for which responses are served without revalidation. Either a number, or a dictionary
+             mapping endpoints to seconds, e.g. `{'/v4/database': 3600, '/v4/data/recessions': 86400}`,
+             with the key `'default'` for all other endpoints. Default is `0`, revalidating on every call.
+
+    Examples:
+        >>> from haver import Haver
+        >>> from haver.http_cache import HTTPCache
+        >>> haver = Haver(http_cache=HTTPCache('~/.haver/http.db', ttl={'/v4/database': 3600, 'default': 60}))
+    """
+
+    def __init__(self, path: str, ttl: Union[float, Dict[str, float]] = 0.):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        # Waits on locks held by other processes rather than failing
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                                      key TEXT PRIMARY KEY,
+                                      etag TEXT,
+                                      last_modified TEXT,
+                                      payload BLOB NOT NULL,
+                                      stored REAL NOT NULL)""")
+
+    def _ttl(self, url: str) -> float:
+        if isinstance(self.ttl, dict):
+            return self.ttl.get(_endpoint(url), self.ttl.get('default', 0.))
+        return self.ttl
+
+    def get(self, key: str, url: str) -> Optional[CachedResponse]:
+        """Returns the response stored under `key`, or `None`. `url` determines its time to live."""
+        with self._lock:
+            row = self._conn.execute("SELECT payload, etag, last_modified, stored FROM responses WHERE key=?",
+                                     (key,)).fetchone()
+        if row is None:
+            return None
+        payload, etag, last_modified, stored = row
+        return CachedResponse(content=zlib.decompress(payload), etag=etag, last_modified=last_modified,
+                              fresh=time.time() - stored < self._ttl(url))
+
+    def put(self, key: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Stores a response body with its validators."""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                               (key, etag, last_modified, zlib.compress(content), time.time()))
+
+    def refresh(self, key: str):
+        """Marks a stored response as fresh again, after a `304 Not Modified` reply."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE responses SET stored=? WHERE key=?", (time.time(), key))
+
+    def clear(self):
+        """Removes all responses from the cache."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        """Closes the underlying SQLite connection."""
+        self._conn.close()
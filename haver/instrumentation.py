@@ -0,0 +1,177 @@
+"""  Created on 18/10/2026::
+------------- instrumentation.py -------------
+
+Hooks to observe requests, processing stages and cache lookups of `Haver` and `AsyncHaver`,
+and a built-in in-memory stats collector.
+
+**Authors**: L. Mingarelli
+"""
+
+import bisect, re, threading, time, warnings
+from contextlib import contextmanager
+from typing import NamedTuple, Optional, Iterable, Dict, Tuple
+from urllib.parse import urlsplit
+
+
+class RequestEvent(NamedTuple):
+    """Outcome of a request to the API, including all its retries."""
+    endpoint: str
+    url: str
+    status: Optional[int]
+    bytes: int
+    latency: float
+    retries: int
+    error: Optional[BaseException] = None
+
+
+_ENDPOINTS = ((re.compile(r'^/v4/database/[^/]+/series/[^/]+$'), '/v4/database/{database}/series/{series}'),
+              (re.compile(r'^/v4/database/[^/]+/series$'), '/v4/database/{database}/series'))
+
+
+def _endpoint(url: str) -> str:
+    """Maps a request URL to its endpoint template, e.g. `/v4/database/{database}/series/{series}`."""
+    path = urlsplit(url).path
+    for pattern, template in _ENDPOINTS:
+        if pattern.match(path):
+            return template
+    return path
+
+
+class Instrumentation:
+    """Dispatches events to registered hooks.
+
+    A hook is any object implementing one or more of the methods
+        - `on_request(event: RequestEvent)`, called after each request, once all retries are done;
+        - `on_stage(stage: str, seconds: float)`, called with the duration of each processing stage,
+          e.g. `'read_df.fetch'`, `'read_df.build'`, `'get_series.paginate'` or `'decode'`;
+        - `on_cache(cache: str, hit: bool)`, called on each cache lookup, e.g. by the `'series_cache'`.
+    Exceptions raised by hooks are turned into warnings, so that they never interrupt a query.
+    """
+
+    def __init__(self, hooks: Optional[Iterable] = None):
+        self.hooks = list(hooks or [])
+
+    def _emit(self, method: str, *args):
+        for hook in self.hooks:
+            callback = getattr(hook, method, None)
+            if callback is not None:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    warnings.warn(f"Instrumentation hook {hook!r} failed in {method}: {e!r}")
+
+    def request(self, url: str, status: Optional[int], nbytes: int, started: float, retries: int,
+                error: Optional[BaseException] = None):
+        if self.hooks:
+            self._emit('on_request', RequestEvent(endpoint=_endpoint(url), url=url, status=status, bytes=nbytes,
+                                                  latency=time.perf_counter() - started, retries=retries, error=error))
+
+    @contextmanager
+    def stage(self, stage: str):
+        if not self.hooks:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._emit('on_stage', stage, time.perf_counter() - started)
+
+    def cache(self, cache: str, hit: bool):
+        if self.hooks:
+            self._emit('on_cache', cache, hit)
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds, in seconds.
+
+    Args:
+        buckets: Sorted upper bounds of the buckets. An implicit `+inf` bucket is appended.
+    """
+    DEFAULT_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1., 2.5, 5., 10., 30., 60.)
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.
+        self.max = 0.
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimates the `q`-th quantile as the upper bound of the bucket containing it."""
+        if not self.count:
+            return 0.
+        rank, cumulative = q * self.count, 0
+        for bound, n in zip(self.buckets + (self.max,), self.counts):
+            cumulative += n
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {'count': self.count, 'sum': self.sum, 'max': self.max,
+                'mean': self.sum / self.count if self.count else 0.,
+                'p50': self.quantile(.5), 'p99': self.quantile(.99),
+                'buckets': dict(zip(self.buckets + (float('inf'),), self.counts))}
+
+
+class StatsCollector:
+    """In-memory hook collecting counters and latency histograms.
+
+    Examples:
+        >>> from haver import Haver
+        >>> from haver.instrumentation import StatsCollector
+        >>> stats = StatsCollector()
+        >>> haver = Haver(hooks=[stats])
+        >>> haver.read_df(['N997CE@EUDATA','N025CE@EUDATA'])
+        >>> stats.snapshot()
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = Histogram.DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clears all counters and histograms."""
+        with self._lock:
+            self.requests = {}
+            self.statuses = {}
+            self.latency = {}
+            self.stages = {}
+            self.cache = {}
+
+    def on_request(self, event: RequestEvent):
+        with self._lock:
+            counters = self.requests.setdefault(event.endpoint, {'count': 0, 'errors': 0, 'bytes': 0, 'retries': 0})
+            counters['count'] += 1
+            counters['errors'] += event.error is not None or (event.status or 0) >= 400
+            counters['bytes'] += event.bytes
+            counters['retries'] += event.retries
+            status = event.status if event.status is not None else 'error'
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.latency.setdefault(event.endpoint, Histogram(self._buckets)).observe(event.latency)
+
+    def on_stage(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages.setdefault(stage, Histogram(self._buckets)).observe(seconds)
+
+    def on_cache(self, cache: str, hit: bool):
+        with self._lock:
+            counters = self.cache.setdefault(cache, {'hits': 0, 'misses': 0})
+            counters['hits' if hit else 'misses'] += 1
+
+    def snapshot(self) -> Dict:
+        """Returns a copy of all counters and histogram summaries, e.g. for export to a metrics system."""
+        with self._lock:
+            return {'requests': {endpoint: dict(counters) for endpoint, counters in self.requests.items()},
+                    'statuses': dict(self.statuses),
+                    'latency': {endpoint: h.to_dict() for endpoint, h in self.latency.items()},
+                    'stages': {stage: h.to_dict() for stage, h in self.stages.items()},
+                    'cache': {cache: dict(counters) for cache, counters in self.cache.items()}}
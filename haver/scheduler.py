@@ -0,0 +1,156 @@
+"""  Created on 18/10/2026::
+------------- scheduler.py -------------
+
+Building blocks of the request layer shared by `Haver` and `AsyncHaver`:
+retries with exponential backoff, client-side rate limiting, and a circuit breaker.
+
+**Authors**: L. Mingarelli
+"""
+
+import email.utils, random, threading, time
+from typing import Optional, Tuple
+
+from haver.exceptions import CircuitOpenError
+
+
+class RetryPolicy:
+    """Retries with exponential backoff and full jitter.
+
+    The delay before retry number `attempt` (starting from 0) is drawn uniformly between
+    0 and `min(max_backoff, backoff_factor * 2**attempt)`, unless the response carries a
+    `Retry-After` header, which is honoured instead.
+
+    Args:
+        max_retries: Maximum number of retries after the first attempt.
+        backoff_factor: Base delay in seconds.
+        max_backoff: Maximum delay in seconds.
+        jitter: If `False`, the delay is the upper bound itself.
+        retry_statuses: HTTP status codes which are retried.
+    """
+    def __init__(self, max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30.,
+                 jitter: bool = True,
+                 retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Returns the number of seconds to wait before retry number `attempt`."""
+        if retry_after:
+            seconds = _parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+def _parse_retry_after(retry_after: str) -> Optional[float]:
+    """Parses a `Retry-After` header, given either in seconds or as an HTTP date."""
+    try:
+        return max(0., float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0., email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Client-side token-bucket rate limiter, with an optional cap on concurrent requests.
+
+    Args:
+        rate: Sustained number of requests per second. `None` disables rate limiting.
+        burst: Bucket capacity, i.e. the number of requests which can be sent at once after a pause.
+               Defaults to `max(1, rate)`.
+        max_concurrent: Maximum number of requests in flight. `None` disables the cap.
+                        Only enforced by the synchronous client, `AsyncHaver` bounds concurrency
+                        through `max_concurrency` instead.
+    """
+    def __init__(self, rate: Optional[float] = None,
+                 burst: Optional[float] = None,
+                 max_concurrent: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1., rate or 1.)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+    def reserve(self) -> float:
+        """Takes a token, returning the number of seconds to wait before it becomes valid."""
+        if self.rate is None:
+            return 0.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0., -self._tokens / self.rate)
+
+    def __enter__(self):
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class CircuitBreaker:
+    """Fails fast while the API is down.
+
+    After `failure_threshold` consecutive failures (connection errors or 5xx responses)
+    the circuit opens, and requests raise `CircuitOpenError` without being sent.
+    After `reset_timeout` seconds a single trial request is let through: if it succeeds
+    the circuit closes again, otherwise it stays open for another `reset_timeout`.
+
+    Args:
+        failure_threshold: Number of consecutive failures opening the circuit.
+        reset_timeout: Seconds after which a trial request is let through.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self, url: Optional[str] = None):
+        """Raises `CircuitOpenError` if the circuit is open and no trial request is due."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if not self._trial and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._trial = True
+                return
+        raise CircuitOpenError(f"Circuit breaker open after {self._failures} consecutive failures; "
+                               f"not sending request.", url=url)
+
+    def record_success(self):
+        with self._lock:
+            self._failures, self._opened_at, self._trial = 0, None, False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at, self._trial = time.monotonic(), False
+
+    def release_trial(self):
+        """Lets another trial request through, after one ended without a recorded outcome, e.g. being interrupted."""
+        with self._lock:
+            self._trial = False
@@ -0,0 +1,118 @@
+"""  Created on 18/10/2026::
+------------- store.py -------------
+
+Columnar on-disk store of Haver series, as Parquet or Arrow IPC datasets
+partitioned by database and frequency. Requires `pyarrow`.
+
+**Authors**: L. Mingarelli
+"""
+
+import datetime, uuid
+from typing import Optional, Union, List, Iterable, TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+
+_FORMATS = ('parquet', 'ipc')
+_PARTITIONING = ['database', 'frequency']
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow, pyarrow.dataset, pyarrow.fs
+    except ImportError as e:
+        raise ImportError("The columnar store requires `pyarrow`, which can be installed as `pip install pyarrow`.") from e
+    return pyarrow
+
+
+def _check_format(format: str):
+    if format not in _FORMATS:
+        raise ValueError(f"The argument 'format' must be one of {_FORMATS}, instead '{format}' was passed.")
+
+
+def write_store(df: 'pd.DataFrame', path: str,
+                format: str = 'parquet',
+                mode: str = 'append'):
+    """Writes a long DataFrame, as returned by `Haver.read_df`, to a partitioned dataset.
+
+    The frame must contain a `frequency` column in addition to the columns returned by `read_df`.
+    Files are laid out as `{path}/database={database}/frequency={frequency}/*.{format}`.
+
+    Args:
+        df: Long DataFrame with columns date, country, country_alpha2, country_name, database, variable, value and frequency.
+        path: Root directory of the dataset.
+        format: Either `'parquet'` (default) or `'ipc'` (Arrow IPC / Feather v2, best suited to memory-mapped reads).
+        mode: Either `'append'` (default), which adds new files to the dataset, or `'overwrite'`,
+              which replaces all partitions written to.
+    """
+    pa = _import_pyarrow()
+    _check_format(format)
+    if mode not in ('append', 'overwrite'):
+        raise ValueError(f"The argument 'mode' must be either 'append' or 'overwrite', instead '{mode}' was passed.")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pa.dataset.write_dataset(table, path, format=format,
+                             partitioning=_PARTITIONING, partitioning_flavor='hive',
+                             basename_template=f'part-{uuid.uuid4().hex}-{{i}}.{"arrow" if format == "ipc" else format}',
+                             existing_data_behavior='overwrite_or_ignore' if mode == 'append' else 'delete_matching')
+
+
+def load_store(path: str,
+               haver_codes: Optional[Iterable[str]] = None,
+               columns: Optional[List[str]] = None,
+               start: Union[str, datetime.date, None] = None,
+               end: Union[str, datetime.date, None] = None,
+               databases: Optional[Iterable[str]] = None,
+               frequencies: Optional[Iterable[str]] = None,
+               format: str = 'parquet',
+               as_arrow: bool = False):
+    """Loads series from a dataset written by `write_store`.
+
+    Files are memory-mapped, and the column selection and all filters are pushed down to the
+    dataset scan, so that only the partitions, row groups and columns needed are read.
+    With `format='ipc'` and uncompressed files, reads are zero-copy.
+
+    Args:
+        path: Root directory of the dataset.
+        haver_codes: Haver codes `{series}@{database}` to load. Default is all series.
+        columns: Columns to load. Default is all columns.
+        start: Earliest date to load (inclusive).
+        end: Latest date to load (inclusive).
+        databases: Databases to load. Default is all databases.
+        frequencies: Haver frequency codes to load, e.g. `['M', 'Q']`. Default is all frequencies.
+        format: Either `'parquet'` (default) or `'ipc'`.
+        as_arrow: If `True`, returns a `pyarrow.Table` instead of a `pandas.DataFrame`.
+
+    Returns:
+        pandas.DataFrame or pyarrow.Table
+    """
+    import pandas as pd
+    pa = _import_pyarrow()
+    _check_format(format)
+    dataset = pa.dataset.dataset(path, format=format, partitioning='hive',
+                                 filesystem=pa.fs.LocalFileSystem(use_mmap=True))
+    field = pa.dataset.field
+
+    filters = []
+    if haver_codes is not None:
+        by_database = {}
+        for haver_code in haver_codes:
+            series, database = haver_code.split(sep='@')
+            by_database.setdefault(database.lower(), []).append(series.lower())
+        code_filter = None
+        for database, series in by_database.items():
+            expr = (field('database') == database) & field('variable').isin(series)
+            code_filter = expr if code_filter is None else code_filter | expr
+        filters.append(code_filter if code_filter is not None else pa.dataset.scalar(False))
+    if databases is not None:
+        filters.append(field('database').isin([db.lower() for db in databases]))
+    if frequencies is not None:
+        filters.append(field('frequency').isin(list(frequencies)))
+    if start is not None:
+        filters.append(field('date') >= pa.scalar(pd.Timestamp(start).to_pydatetime(), type=dataset.schema.field('date').type))
+    if end is not None:
+        filters.append(field('date') <= pa.scalar(pd.Timestamp(end).to_pydatetime(), type=dataset.schema.field('date').type))
+
+    expression = None
+    for f in filters:
+        expression = f if expression is None else expression & f
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table if as_arrow else table.to_pandas()
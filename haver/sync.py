@@ -0,0 +1,63 @@
+"""  Created on 18/10/2026::
+------------- sync.py -------------
+
+**Authors**: L. Mingarelli
+"""
+
+import json, os, threading
+from typing import Dict, List
+
+
+class SyncState:
+    """Persistent state of `Haver.sync`, stored as a JSON file.
+
+    For each database, the state records the `datetimeLastModified` and `dataPointCount`
+    of every series as of the last successful sync, against which the current metadata is diffed.
+
+    Args:
+        path: Path to the JSON file. It is created on the first save.
+
+    Examples:
+        >>> from haver import Haver
+        >>> from haver.sync import SyncState
+        >>> haver = Haver()
+        >>> state = SyncState('~/.haver/sync_state.json')
+        >>> changed = haver.sync('EUDATA', state=state)
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self._state = json.load(f)
+        else:
+            self._state = {}
+
+    def get(self, database: str) -> Dict[str, List]:
+        """Returns the `{series: [datetimeLastModified, dataPointCount]}` mapping of `database`."""
+        with self._lock:
+            return dict(self._state.get(database.upper(), {}))
+
+    def update(self, database: str, series: Dict[str, List], removed=()):
+        """Records the current version of `series` in `database`, drops the `removed` series, and saves."""
+        with self._lock:
+            db_state = self._state.setdefault(database.upper(), {})
+            db_state.update(series)
+            for name in removed:
+                db_state.pop(name, None)
+            self._save()
+
+    def _save(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def databases(self) -> List[str]:
+        """Names of the databases recorded in the state."""
+        with self._lock:
+            return list(self._state)
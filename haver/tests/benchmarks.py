@@ -0,0 +1,134 @@
+"""  Created on 18/10/2026::
+------------- benchmarks.py -------------
+
+Offline benchmarks of `Haver` against the local `MockHaverAPI`.
+Results are saved as JSON, and compared with the previous run in the same directory.
+
+Usage:
+    python -m haver.tests.benchmarks [--output-dir bench_results] [--latency 0.005] [--quick]
+
+**Authors**: L. Mingarelli
+"""
+
+import argparse, datetime, glob, json, os, platform, subprocess, time, tracemalloc
+
+from haver import Haver
+from haver.tests.mock_api import MockHaverAPI
+
+
+def _measure(fn, repeat: int = 1):
+    """Returns the best wall time in seconds over `repeat` runs, and the peak traced memory in MB of one more run.
+
+    Memory is traced in a separate run, since tracing slows down execution considerably.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return best, peak
+
+
+def bench_read_df_n_series(latency: float, sizes=(10, 100, 1000), workers=(1, 16)):
+    results = []
+    with MockHaverAPI(databases={'USECON': max(sizes)}, n_points=240, latency=latency) as api:
+        haver = Haver(api_key=api.api_key, base_url=api.url, pool_maxsize=max(workers), lazy=True)
+        for n in sizes:
+            codes = [f'S{i:06d}@USECON' for i in range(n)]
+            for max_workers in workers:
+                seconds, peak = _measure(lambda: haver.read_df(codes, max_workers=max_workers))
+                results.append({'n_series': n, 'max_workers': max_workers, 'seconds': seconds,
+                                'series_per_second': n / seconds, 'peak_mb': peak})
+        haver.close()
+    return results
+
+
+def bench_read_df_series_length(latency: float, lengths=(120, 1200, 12000), n_series: int = 50):
+    results = []
+    for n_points in lengths:
+        with MockHaverAPI(databases={'USECON': n_series}, n_points=n_points, latency=latency) as api:
+            haver = Haver(api_key=api.api_key, base_url=api.url, lazy=True)
+            codes = [f'S{i:06d}@USECON' for i in range(n_series)]
+            seconds, peak = _measure(lambda: haver.read_df(codes), repeat=2)
+            results.append({'n_points': n_points, 'n_series': n_series, 'seconds': seconds,
+                            'rows_per_second': n_points * n_series / seconds, 'peak_mb': peak})
+            haver.close()
+    return results
+
+
+def bench_get_series(latency: float, sizes=(10_000, 100_000)):
+    results = []
+    for n in sizes:
+        with MockHaverAPI(databases={'BIGDB': n}, latency=latency) as api:
+            haver = Haver(api_key=api.api_key, base_url=api.url, lazy=True)
+            seconds, peak = _measure(lambda: haver._list_series('BIGDB'))
+            results.append({'n_series': n, 'pages': -(-n // 1000), 'seconds': seconds,
+                            'series_per_second': n / seconds, 'peak_mb': peak})
+            haver.close()
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__)).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _compare(previous: dict, current: dict):
+    """Prints the relative change in seconds of each benchmark case with respect to `previous`."""
+    for name, cases in current['benchmarks'].items():
+        for case, old in zip(cases, previous.get('benchmarks', {}).get(name, [])):
+            params = {k: v for k, v in case.items() if k not in ('seconds', 'peak_mb') and not k.endswith('per_second')}
+            if params == {k: v for k, v in old.items() if k in params}:
+                change = case['seconds'] / old['seconds'] - 1
+                print(f"{name:<28} {json.dumps(params):<44} {case['seconds']:9.4f}s  {change:+7.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks of haver against a local mock API.")
+    parser.add_argument('--output-dir', default='bench_results', help="Directory where results are saved.")
+    parser.add_argument('--latency', type=float, default=0.005, help="Latency in seconds added to every response.")
+    parser.add_argument('--quick', action='store_true', help="Run smaller cases only.")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        benchmarks = {'read_df_n_series': lambda: bench_read_df_n_series(args.latency, sizes=(10, 100)),
+                      'read_df_series_length': lambda: bench_read_df_series_length(args.latency, lengths=(120, 1200)),
+                      'get_series_pagination': lambda: bench_get_series(args.latency, sizes=(10_000,))}
+    else:
+        benchmarks = {'read_df_n_series': lambda: bench_read_df_n_series(args.latency),
+                      'read_df_series_length': lambda: bench_read_df_series_length(args.latency),
+                      'get_series_pagination': lambda: bench_get_series(args.latency)}
+
+    current = {'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+               'revision': _git_revision(), 'python': platform.python_version(),
+               'latency': args.latency, 'quick': args.quick, 'benchmarks': {}}
+    for name, bench in benchmarks.items():
+        current['benchmarks'][name] = bench()
+        for case in current['benchmarks'][name]:
+            print(name, json.dumps(case))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    previous_runs = sorted(glob.glob(os.path.join(args.output_dir, 'bench_*.json')))
+    path = os.path.join(args.output_dir, f"bench_{current['timestamp'].replace(':', '')}.json")
+    with open(path, 'w') as f:
+        json.dump(current, f, indent=2)
+    print(f"Results saved to {path}")
+
+    if previous_runs:
+        with open(previous_runs[-1]) as f:
+            previous = json.load(f)
+        if previous.get('latency') == args.latency:
+            print(f"\nChange with respect to {previous_runs[-1]} (revision {previous.get('revision')}):")
+            _compare(previous, current)
+    return current
+
+
+if __name__ == '__main__':
+    main()
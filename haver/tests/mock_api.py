@@ -0,0 +1,177 @@
+"""  Created on 18/10/2026::
+------------- mock_api.py -------------
+
+Local stand-in for the Haver View v4 API, serving synthetic payloads
+for offline tests and benchmarks.
+
+**Authors**: L. Mingarelli
+"""
+
+import bisect, gzip, hashlib, json, threading, time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+from typing import Dict, Optional
+
+
+class MockHaverAPI:
+    """Serves the v4 endpoints used by `Haver` from synthetic data.
+
+    Series are named `S000000`, `S000001`, ... within each database, and their data points
+    are monthly observations starting in January 1990. Their geography cycles through the United States,
+    Germany and the United Kingdom. The series listing is paged by name, as the real API does.
+    Successful responses carry an `ETag`, and requests with a matching `If-None-Match` are answered with `304`.
+
+    Args:
+        databases: Mapping of database names to their number of series.
+        n_points: Number of data points of each series.
+        latency: Seconds added to every response.
+        api_key: The only API key accepted.
+        gzip: If `True`, bodies are gzip-compressed for clients accepting it.
+
+    Examples:
+        >>> from haver import Haver
+        >>> with MockHaverAPI(databases={'USECON': 100_000}, latency=0.01) as api:
+        ...     haver = Haver(api_key=api.api_key, base_url=api.url)
+        ...     haver.get_series('USECON')
+    """
+
+    def __init__(self, databases: Optional[Dict[str, int]] = None,
+                 n_points: int = 240,
+                 latency: float = 0.,
+                 api_key: str = 'mock-api-key',
+                 gzip: bool = False):
+        self.databases = {db: [f'S{i:06d}' for i in range(n)]
+                          for db, n in (databases or {'USECON': 1000, 'EUDATA': 100}).items()}
+        self.n_points = n_points
+        self.latency = latency
+        self.api_key = api_key
+        self.gzip = gzip
+        self.last_modified = {}
+        self.requests = []
+        self.responses = []
+        self._failures = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}'
+
+    def start(self):
+        api = self
+
+        class Handler(_Handler):
+            mock = api
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail_next(self, n: int = 1, status: int = 503, retry_after: Optional[str] = '0'):
+        """Makes the next `n` requests fail with `status`."""
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * n)
+
+    def touch(self, database: str, series: str, last_modified: str = '2030-01-01T00:00:00'):
+        """Changes the `datetimeLastModified` of a series."""
+        self.last_modified[(database, series)] = last_modified
+
+    GEOGRAPHIES = ('111', '134', '112')
+
+    def metadata(self, database: str, series: str) -> Dict:
+        return {'name': series, 'databaseName': database,
+                'description': f'Synthetic series {series} of {database}',
+                'datetimeLastModified': self.last_modified.get((database, series), '2024-01-01T00:00:00'),
+                'startingPeriod': 1, 'dataPointCount': self.n_points, 'frequency': 'M',
+                'geography': self.GEOGRAPHIES[int(series[1:]) % 3], 'geography2': '', 'startDate': '1990-01-01'}
+
+    def series(self, database: str, series: str) -> Dict:
+        offset = int(series[1:])
+        return {**self.metadata(database, series),
+                'dataPoints': [{'date': f'{1990 + k // 12}-{k % 12 + 1:02d}-01', 'nSeriesData': float(offset + k)}
+                               for k in range(self.n_points)]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    wbufsize = -1  # Buffer headers and body, so that each response is written at once
+    mock: MockHaverAPI = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        mock = self.mock
+        with mock._lock:
+            mock.requests.append(self.path)
+            failure = mock._failures.pop(0) if mock._failures else None
+        if mock.latency:
+            time.sleep(mock.latency)
+        if failure is not None:
+            status, retry_after = failure
+            return self._send(status, {'error': 'Injected failure'},
+                              headers={'Retry-After': retry_after} if retry_after is not None else {})
+        if self.headers.get('X-API-Key') != mock.api_key:
+            return self._send(401, {'error': 'Invalid API key'})
+
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        path = [unquote(p) for p in url.path.strip('/').split('/')]
+
+        if path == ['v4', 'docs']:
+            return self._send(200, {})
+        if path == ['v4', 'database']:
+            return self._send(200, [{'name': db, 'description': f'Synthetic database {db}'} for db in mock.databases])
+        if path[:2] == ['v4', 'database'] and len(path) in (4, 5) and path[3] == 'series':
+            database = path[2].upper()
+            if database not in mock.databases:
+                return self._send(404, {'error': f'Database {database} not found'})
+            names = mock.databases[database]
+            if len(path) == 5:
+                series = path[4].upper()
+                i = bisect.bisect_left(names, series)
+                if i == len(names) or names[i] != series:
+                    return self._send(404, {'error': f'Series {series} not found'})
+                return self._send(200, mock.series(database, series))
+            start = bisect.bisect_left(names, query['page'].upper()) if query.get('page') else 0
+            per_page = int(query.get('per_page', 1000))
+            return self._send(200, {'data': [mock.metadata(database, s) for s in names[start:start + per_page]]})
+        if path == ['v4', 'data', 'search']:
+            term = query.get('query', '').upper()
+            return self._send(200, {'data': [mock.metadata(db, s) for db, names in mock.databases.items()
+                                             for s in names if term in s][:1000]})
+        if path == ['v4', 'data', 'recessions']:
+            return self._send(200, {'data': [{'index': 0, 'country': '111',
+                                              'startDate': '2007-12-01', 'endDate': '2009-06-01'}]})
+        return self._send(404, {'error': 'Not found'})
+
+    def _send(self, status: int, content, headers: Optional[Dict] = None):
+        body = json.dumps(content).encode()
+        headers = dict(headers or {})
+        if status == 200:
+            headers['ETag'] = f'"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get('If-None-Match') == headers['ETag']:
+                status, body = 304, b''
+        if body and self.mock.gzip and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        with self.mock._lock:
+            self.mock.responses.append((status, headers.get('Content-Encoding')))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
@@ -6,6 +6,7 @@
 
 from haver import Haver
 import os
+import pandas as pd
 
 haver = Haver(api_key=os.getenv('HAVER_API_KEY'))
 
@@ -16,6 +17,15 @@ if haver._is_connected:
         def test_HAVER_connection(self):
             assert haver._is_connected
 
+        def test_HAVER_lazy(self):
+            from haver import HaverAuthError
+            assert Haver(api_key=os.getenv('HAVER_API_KEY'), lazy=True).read(database='EUDATA', series='N997CE')
+            try:
+                Haver(api_key='invalid-api-key', lazy=True).get_databases()
+                assert False
+            except HaverAuthError:
+                pass
+
         def test_HAVER_explore(self):
             haver.get_databases()
             assert haver.database_info('EPFRBCF')['description'] == 'Bond Country Flows: ETFs/Mutu Fnd: Africa: Est Ending Alloc (EOP, Mil. US$)'
@@ -23,6 +33,10 @@ if haver._is_connected:
             haver.get_series('USECON', like='A111F9S', full_info=False)
             # haver.search(query='defined')
 
+        def test_HAVER_series_for_country(self):
+            haver_codes = haver.series_for_country('DE', databases='EUDATA')
+            assert haver_codes and all(code.endswith('@EUDATA') for code in haver_codes)
+
         def test_HAVER_recessions(self):
             # assert haver.recessions().shape[0] > 300
             pass
@@ -30,9 +44,69 @@ if haver._is_connected:
         def test_HAVER_read(self):
             assert haver.read(database='EUDATA', series='N997CE')
 
+        def test_HAVER_read_arrays(self):
+            dates, values = haver.read_arrays(database='EUDATA', series='N997CE')
+            assert dates.dtype == 'datetime64[D]' and values.dtype == 'float64'
+            assert dates.shape == values.shape and dates.shape[0] > 100
+
         def test_HAVER_read_df(self):
             assert haver.read_df(haver_codes=['N997CE@EUDATA']).shape[0] > 100
 
+        def test_HAVER_read_df_concurrent(self):
+            codes = ['N997CE@EUDATA', 'N025CE@EUDATA', 'NOTASERIES@EUDATA']
+            df = haver.read_df(haver_codes=codes, max_workers=4, errors='ignore')
+            assert list(df.variable.unique()) == ['n997ce', 'n025ce']
+            assert list(df.attrs['errors']) == ['NOTASERIES@EUDATA']
+
+        def test_HAVER_cache(self, tmp_path):
+            with Haver(api_key=os.getenv('HAVER_API_KEY'), cache=str(tmp_path / 'series.db')) as h:
+                data = h.read(database='EUDATA', series='N997CE')
+                assert ('EUDATA', 'N997CE') in h._cache
+                assert h.read(database='EUDATA', series='N997CE') == data
+
+        def test_HAVER_catalog(self, tmp_path):
+            from haver.catalog import SeriesCatalog
+            catalog = SeriesCatalog(str(tmp_path / 'catalog.db'))
+            assert catalog.sync(haver, databases=['EUDATA']) == ['EUDATA']
+            assert catalog.sync(haver) == []
+            assert catalog.get_series('EUDATA') == haver.get_series('EUDATA')
+            assert any(s['name'] == 'N997CE' for s in catalog.search(prefix='N997', database='EUDATA'))
+
+        def test_HAVER_sync(self, tmp_path):
+            state = str(tmp_path / 'sync_state.json')
+            assert 'N997CE@EUDATA' in haver.sync('EUDATA', state=state, max_workers=8)
+            assert haver.sync('EUDATA', state=state) == {}
+
+        def test_HAVER_async(self):
+            import asyncio
+            from haver import AsyncHaver
+
+            async def _read_df():
+                async with AsyncHaver(api_key=os.getenv('HAVER_API_KEY')) as h:
+                    return await h.read_df(haver_codes=['N997CE@EUDATA', 'N025CE@EUDATA'])
+            df = asyncio.run(_read_df())
+            assert list(df.variable.unique()) == ['n997ce', 'n025ce']
+
+        def test_HAVER_export(self, tmp_path):
+            codes = ['N997CE@EUDATA', 'N025CE@EUDATA']
+            assert haver.export(haver_codes=codes, path=str(tmp_path), format='ipc') == {}
+            df = Haver.load(str(tmp_path), haver_codes=codes[:1], start='2020-01-01', format='ipc')
+            assert set(df.variable) == {'n997ce'} and df.date.min() >= pd.Timestamp('2020-01-01')
+
+        def test_HAVER_instrumentation(self):
+            from haver.instrumentation import StatsCollector
+            stats = StatsCollector()
+            h = Haver(api_key=os.getenv('HAVER_API_KEY'), hooks=[stats])
+            h.read_df(haver_codes=['N997CE@EUDATA', 'N025CE@EUDATA'])
+            snapshot = stats.snapshot()
+            assert snapshot['requests']['/v4/database/{database}/series/{series}']['count'] == 2
+            assert {'decode', 'read_df.fetch', 'read_df.build'} <= set(snapshot['stages'])
+
+        def test_HAVER_session(self):
+            with Haver(api_key=os.getenv('HAVER_API_KEY'), pool_maxsize=4, timeout=60) as h:
+                assert h.read(database='EUDATA', series='N997CE')
+                assert h.read(database='EUDATA', series='N025CE')
+
 
 
 
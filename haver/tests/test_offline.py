@@ -0,0 +1,230 @@
+"""  Created on 18/10/2026::
+------------- test_offline.py -------------
+
+Tests against the local `MockHaverAPI`, not requiring an API key.
+
+**Authors**: L. Mingarelli
+"""
+
+import asyncio, importlib.util, time
+import pytest
+
+from haver import Haver, AsyncHaver, HaverAPIError, HaverAuthError
+from haver.tests.mock_api import MockHaverAPI
+
+
+@pytest.fixture(scope='module')
+def api():
+    with MockHaverAPI(databases={'USECON': 2500, 'EUDATA': 50}, n_points=24) as api:
+        yield api
+
+
+@pytest.fixture
+def haver(api):
+    with Haver(api_key=api.api_key, base_url=api.url) as haver:
+        yield haver
+
+
+class TestOffline:
+
+    def test_connection(self, api, haver):
+        assert haver._is_connected
+        assert not Haver(api_key='invalid', base_url=api.url)._is_connected
+        with pytest.raises(HaverAuthError):
+            Haver(api_key='invalid', base_url=api.url, lazy=True).get_databases()
+
+    def test_get_series(self, haver):
+        assert list(haver.get_databases()) == ['USECON', 'EUDATA']
+        series = haver.get_series('USECON')
+        assert len(series) == 2500 and list(series)[:2] == ['S000000', 'S000001']
+        assert len(haver.get_series('USECON', like='S002000', full_info=True)) == 500
+
+    def test_read_df(self, haver):
+        codes = ['S000001@USECON', 'S000002@EUDATA', 'NOTASERIES@EUDATA']
+        df = haver.read_df(codes, max_workers=4, errors='ignore')
+        assert df.shape == (48, 7) and list(df.attrs['errors']) == ['NOTASERIES@EUDATA']
+        assert df.value.dtype == 'float64' and df.variable.dtype == 'category'
+        wide = haver.read_df(codes[:2], wide=True)
+        assert list(wide.columns) == codes[:2] and wide.shape == (24, 2)
+        with pytest.raises(HaverAPIError):
+            haver.read_df(codes)
+
+    def test_countries(self, api, haver, tmp_path):
+        df = haver.read_df(['S000001@EUDATA', 'S000002@EUDATA', 'S000004@EUDATA'])
+        assert list(df.country_alpha2.cat.categories) == ['DE', 'GB'] and df.country_name.iloc[-1] == 'Germany'
+        assert haver.series_for_country('de', databases='EUDATA')[:2] == ['S000001@EUDATA', 'S000004@EUDATA']
+        assert len(haver.series_for_country('GB')) == 833 + 16
+        from haver.catalog import SeriesCatalog
+        catalog = SeriesCatalog(str(tmp_path / 'catalog.db'))
+        catalog.sync(haver, ['EUDATA'])
+        with Haver(api_key=api.api_key, base_url=api.url, catalog=catalog) as h:
+            assert h.series_for_country('DE', databases='EUDATA') == haver.series_for_country('DE', databases='EUDATA')
+
+    def test_window(self, api, haver):
+        content_json = haver.read(database='USECON', series='S000001', start='1990-06-01', end='1990-12-31')
+        assert [dp['date'] for dp in content_json['dataPoints']][::6] == ['1990-06-01', '1990-12-01']
+        assert len(haver.read(database='USECON', series='S000001')['dataPoints']) == 24
+        df = haver.read_df(['S000001@USECON', 'S000002@EUDATA'], last_n=3)
+        assert df.shape == (6, 7) and str(df.date.min())[:10] == '1991-10-01'
+        assert len(haver.read(database='USECON', series='S000001', end='1990-03-01', last_n=5)['dataPoints']) == 3
+        assert haver.read_df(['S000001@USECON'], last_n=100).shape == (24, 7)
+        with pytest.raises(ValueError):
+            haver.read_df(['S000001@USECON'], start='not-a-date', errors='ignore')
+        n_requests = len(api.requests)
+        with pytest.raises(ValueError):
+            haver.read(database='USECON', series='S000001', last_n=-1)
+        assert len(api.requests) == n_requests
+
+    def test_iter_read(self, haver):
+        chunks = list(haver.iter_database('USECON', chunk_size=1000, max_workers=8))
+        assert [len(df) for df in chunks] == [24000, 24000, 12000]
+        written = []
+        assert haver.iter_read((f'S{i:06d}@EUDATA' for i in range(25)), chunk_size=10, sink=written.append) == 600
+        assert [df.variable.nunique() for df in written] == [10, 10, 5]
+
+    def test_retry(self, api, haver):
+        api.fail_next(2, status=503)
+        assert haver.read(database='USECON', series='S000001')['name'] == 'S000001'
+
+    def test_circuit_breaker(self, api, monkeypatch):
+        import requests
+        from haver.scheduler import CircuitBreaker
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.)
+        with Haver(api_key=api.api_key, base_url=api.url, lazy=True, retry=0, circuit_breaker=breaker) as h:
+            api.fail_next(1, status=503)
+            with pytest.raises(HaverAPIError):
+                h.get_databases()
+            assert breaker.is_open
+            for error in (requests.exceptions.ChunkedEncodingError(), RuntimeError()):
+                def _get(*args, **kwargs):
+                    raise error
+                monkeypatch.setattr(h._session, 'get', _get)
+                with pytest.raises((HaverAPIError, RuntimeError)):
+                    h.get_databases()
+            monkeypatch.undo()
+            assert h.get_databases() and not breaker.is_open
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        with Haver(api_key=api.api_key, base_url='htp://invalid', lazy=True, retry=3, circuit_breaker=breaker) as h:
+            started = time.perf_counter()
+            with pytest.raises(HaverAPIError):
+                h.get_databases()
+            assert time.perf_counter() - started < .5 and not breaker.is_open
+
+    def test_coalescing(self, api):
+        import threading
+        with Haver(api_key=api.api_key, base_url=api.url, response_ttl=60) as h:
+            n_requests = len(api.requests)
+            threads = [threading.Thread(target=h.read, args=('USECON', 'S000020')) for _ in range(8)]
+            [t.start() for t in threads]
+            [t.join() for t in threads]
+            h.read_df(['S000020@USECON', 'S000021@USECON', 'S000021@USECON'], max_workers=4)
+            assert len(api.requests) - n_requests == 2
+
+    def test_cache(self, api, haver, tmp_path):
+        with Haver(api_key=api.api_key, base_url=api.url, cache=str(tmp_path / 'series.db')) as h:
+            h.read(database='USECON', series='S000010')
+            n_requests = len(api.requests)
+            h.read(database='USECON', series='S000010')
+            assert api.requests[n_requests:] == ['/v4/database/USECON/series?&page=S000010&per_page=1']
+            api.touch('USECON', 'S000010')
+            h.read(database='USECON', series='S000010')
+            assert api.requests[-1] == '/v4/database/USECON/series/S000010'
+
+    def test_catalog_and_sync(self, api, haver, tmp_path):
+        from haver.catalog import SeriesCatalog
+        catalog = SeriesCatalog(str(tmp_path / 'catalog.db'))
+        assert catalog.sync(haver, ['EUDATA']) == ['EUDATA'] and catalog.sync(haver) == []
+        assert catalog.get_series('EUDATA') == haver.get_series('EUDATA')
+        assert len(catalog.search(prefix='S00001', database='EUDATA')) == 10
+
+        state = str(tmp_path / 'sync.json')
+        assert len(haver.sync('EUDATA', state=state, max_workers=4)) == 50
+        api.touch('EUDATA', 'S000003')
+        assert list(haver.sync('EUDATA', state=state)) == ['S000003@EUDATA']
+
+    def test_http_cache(self, tmp_path):
+        from haver.http_cache import HTTPCache
+        with MockHaverAPI(databases={'EUDATA': 10}, gzip=True) as api:
+            http_cache = HTTPCache(str(tmp_path / 'http.db'), ttl={'/v4/data/recessions': 60})
+            for _ in range(2):
+                with Haver(api_key=api.api_key, base_url=api.url, http_cache=http_cache, lazy=True) as h:
+                    assert list(h.get_databases()) == ['EUDATA'] and len(h.recessions()) == 1
+            assert api.requests == ['/v4/database?&per_page=1000', '/v4/data/recessions?&per_page=1000',
+                                    '/v4/database?&per_page=1000']
+            assert api.responses == [(200, 'gzip'), (200, 'gzip'), (304, None)]
+
+    def test_catalog_refresh(self, tmp_path):
+        from haver.catalog import SeriesCatalog
+        with MockHaverAPI(databases={'EUDATA': 10}) as api, \
+                Haver(api_key=api.api_key, base_url=api.url, lazy=True) as h:
+            catalog = SeriesCatalog(str(tmp_path / 'catalog.db'))
+            catalog.sync(h, ['EUDATA'])
+            api.touch('EUDATA', 'S000003')
+            api.databases['EUDATA'].append('S000010')
+            assert catalog.sync(h) == []
+            with catalog._conn:  # Ages the last sync by more than the default `max_age`
+                catalog._conn.execute("UPDATE databases SET synced=synced-86401")
+            with Haver(api_key=api.api_key, base_url=api.url, lazy=True, catalog=catalog) as hc:
+                assert len(hc.get_series('EUDATA')) == 10
+                assert catalog.sync(h) == ['EUDATA'] and len(catalog.get_series('EUDATA')) == 11
+                assert len(hc.get_series('EUDATA')) == 11
+                hc.get_series('EUDATA').clear()
+                assert len(hc.get_series('EUDATA')) == 11
+            assert catalog.search(prefix='S000003')[0]['datetimeLastModified'] == '2030-01-01T00:00:00'
+
+    @pytest.mark.skipif(importlib.util.find_spec('pyarrow') is None, reason="requires pyarrow")
+    def test_export(self, haver, tmp_path):
+        haver.export(['S000001@USECON', 'S000002@EUDATA'], path=str(tmp_path), format='ipc')
+        df = Haver.load(str(tmp_path), haver_codes=['S000002@EUDATA'], start='1991-01-01', format='ipc')
+        assert df.shape[0] == 12 and set(df.variable) == {'s000002'}
+
+    @pytest.mark.skipif(importlib.util.find_spec('pyarrow') is None, reason="requires pyarrow")
+    def test_mirror(self, api, tmp_path, monkeypatch):
+        from haver.cli import main
+        args = ['mirror', '--path', str(tmp_path), '--api-key', api.api_key, '--base-url', api.url,
+                '--format', 'ipc', '--chunk-size', '20', '--workers', '4', '--quiet']
+        codes = [f'S{i:06d}@EUDATA' for i in range(30)]
+        assert main(args + ['--errors', 'raise'] + codes[:25] + ['NOTASERIES@EUDATA'] + codes[25:]) == 1
+        n_requests = len(api.requests)
+        assert main(args + ['--errors', 'ignore'] + codes[:25] + ['NOTASERIES@EUDATA'] + codes[25:]) == 0
+        assert len(api.requests) - n_requests == 11
+        assert Haver.load(str(tmp_path), format='ipc').variable.nunique() == 30
+        assert main(args + ['--restart', 'USECON']) == 0
+        assert Haver.load(str(tmp_path), format='ipc', databases=['USECON']).shape == (2500 * 24, 8)
+
+        # Mirroring some codes of a database keeps its other series, as does a failure under --errors ignore
+        assert main(args + ['--restart', 'EUDATA']) == 0
+        assert main(args + ['S000001@EUDATA']) == 0
+        api.fail_next(1, status=404)
+        assert main(args + ['--errors', 'ignore', 'S000002@EUDATA', 'S000003@EUDATA']) == 0
+        df = Haver.load(str(tmp_path), format='ipc', databases=['EUDATA'])
+        assert df.variable.nunique() == 50 and df.shape[0] == 50 * 24
+        series = api.series
+        monkeypatch.setattr(api, 'series', lambda db, s: api.metadata(db, s) if s == 'S000005' else series(db, s))
+        assert main(args + ['--errors', 'ignore', 'EUDATA']) == 0
+        assert Haver.load(str(tmp_path), format='ipc', databases=['EUDATA']).shape[0] == 50 * 24
+
+        from haver.cli import mirror
+        with Haver(api_key=api.api_key, base_url=api.url, lazy=True) as h:
+            mirror(h, ['S000001@EUDATA'], str(tmp_path), format='ipc', log=None)
+            assert h._instrumentation.hooks == []
+
+    @pytest.mark.skipif(importlib.util.find_spec('aiohttp') is None, reason="requires aiohttp")
+    def test_async(self, api):
+        async def _read_df():
+            async with AsyncHaver(api_key=api.api_key, base_url=api.url) as h:
+                return await h.read_df(['S000001@USECON', 'S000002@EUDATA'])
+        assert asyncio.run(_read_df()).shape == (48, 7)
+
+        async def _read_df_failing():
+            async with AsyncHaver(api_key=api.api_key, base_url=api.url, max_concurrency=2) as h:
+                with pytest.raises(HaverAPIError):
+                    await h.read_df(['NOTASERIES@EUDATA'] + [f'S{i:06d}@USECON' for i in range(100)])
+                await asyncio.sleep(.2)
+                return len(api.requests) - n_requests
+        api.latency, n_requests = 0.01, len(api.requests)
+        try:
+            assert asyncio.run(_read_df_failing()) < 10
+        finally:
+            api.latency = 0.
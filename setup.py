@@ -27,6 +27,8 @@ setuptools.setup(
     packages=['haver', 'haver.tests', 'haver.res'],
     package_data={'':  ['../haver/res/*']},
     install_requires=install_requirements,
+    extras_require={'async': ['aiohttp'], 'store': ['pyarrow'], 'fast': ['orjson']},
+    entry_points={'console_scripts': ['haver=haver.cli:main']},
     classifiers=["Programming Language :: Python :: 3",
                  "License :: OSI Approved :: MIT License",
                  "Operating System :: OS Independent"],